@@ -4,155 +4,260 @@ Create macOS Application Icon for Music Visualizer
 Generates a high-resolution icon with an audio waveform and spectrum design
 """
 
-from PIL import Image, ImageDraw, ImageFont
+import argparse
+import PIL
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
 import os
-import math
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import numpy as np
+from numpy.polynomial import polynomial as P
+
+
+# Icon geometry is fixed, so it is computed once at import time and
+# create_icon() only issues the draw calls.
+
+# High-resolution image for icon (1024x1024 for macOS)
+ICON_SIZE = 1024
+BASE_ICON_PATH = "icons/music_visualizer.png"
+_CENTER_X = ICON_SIZE // 2
+_CENTER_Y = ICON_SIZE // 2
+
+# Background with rounded corners
+_MARGIN = 80
+_BG_RECT = (_MARGIN, _MARGIN, ICON_SIZE - _MARGIN, ICON_SIZE - _MARGIN)
+_CORNER_RADIUS = 120
+
+# Subtle border with audio-themed accent
+_BORDER_MARGIN = _MARGIN - 10
+_BORDER_RECT = (_BORDER_MARGIN, _BORDER_MARGIN, ICON_SIZE - _BORDER_MARGIN,
+                ICON_SIZE - _BORDER_MARGIN)
+
+# Spectrum bars configuration
+_NUM_BARS = 24
+_BAR_WIDTH = 20
+_MAX_BAR_HEIGHT = 300
+_BAR_SPACING = 8
+_BAR_START_X = _CENTER_X - (_NUM_BARS * _BAR_WIDTH +
+                            (_NUM_BARS - 1) * _BAR_SPACING) // 2
+
+# Color gradient from cyan to magenta based on height
+_BAR_PALETTE = (
+    (64, 255, 128, 255),  # Green for low frequencies
+    (64, 255, 255, 255),  # Cyan for mid frequencies
+    (255, 64, 255, 255),  # Magenta for high frequencies
+)
+
+
+# Odd Taylor coefficients of sin(x) up to x**7
+_SIN_COEFFS = (0.0, 1.0, 0.0, -1.0 / 6, 0.0, 1.0 / 120, 0.0, -1.0 / 5040)
+
+
+def _fast_sin(x):
+    """Polynomial sin(x) for arrays, max abs error ~2e-4"""
+    # Reduce to [-pi, pi], then fold onto [-pi/2, pi/2] where the
+    # polynomial is accurate, using sin(x) = sin(pi - x)
+    x = np.remainder(x + np.pi, 2 * np.pi) - np.pi
+    x = np.where(x > np.pi / 2, np.pi - x, x)
+    x = np.where(x < -np.pi / 2, -np.pi - x, x)
+    return P.polyval(x, _SIN_COEFFS)
+
+
+def _bar_geometry():
+    """Return ((x0, y0, x1, y1), color) for each spectrum bar"""
+    # Realistic spectrum curve: higher in middle, lower on sides
+    i = np.arange(_NUM_BARS, dtype=np.float32)
+    normalized_pos = np.abs(i - _NUM_BARS / 2) / (_NUM_BARS / 2)
+    base_height = _MAX_BAR_HEIGHT * (0.3 + 0.7 * (1 - normalized_pos * 0.8))
+    # Add some variation
+    variation = 0.2 + 0.8 * (_fast_sin(i * 0.8) * 0.5 + 0.5)
+    bar_heights = base_height * variation
+
+    bar_x = _BAR_START_X + np.arange(_NUM_BARS) * (_BAR_WIDTH + _BAR_SPACING)
+    bar_y_top = _CENTER_Y - bar_heights // 2
+    bar_y_bottom = _CENTER_Y + bar_heights // 2
+
+    height_ratio = bar_heights / _MAX_BAR_HEIGHT
+    color_index = np.select([height_ratio > 0.7, height_ratio > 0.4], [2, 1],
+                            default=0)
+
+    return tuple(((x, y_top, x + _BAR_WIDTH, y_bottom), _BAR_PALETTE[ci])
+                 for x, y_top, y_bottom, ci in zip(
+                     bar_x.tolist(), bar_y_top.tolist(),
+                     bar_y_bottom.tolist(), color_index.tolist()))
+
+
+_BARS = _bar_geometry()
+
+
+def _bar_stencil():
+    """Rasterize one full-height rounded bar to reuse as a mask"""
+    stencil = Image.new('L', (_BAR_WIDTH + 1, _MAX_BAR_HEIGHT + 1), 0)
+    ImageDraw.Draw(stencil).rounded_rectangle(
+        [0, 0, _BAR_WIDTH, _MAX_BAR_HEIGHT], _BAR_WIDTH // 4, fill=255)
+    return stencil
+
+
+def _bar_mask(stencil, height):
+    """Cut a bar mask of the given height from the stencil's two ends"""
+    mask = Image.new('L', (stencil.width, height), 0)
+    upper = height // 2
+    mask.paste(stencil.crop((0, 0, stencil.width, upper)), (0, 0))
+    mask.paste(
+        stencil.crop((0, stencil.height - (height - upper), stencil.width,
+                      stencil.height)), (0, upper))
+    return mask
+
+# Waveform in the bottom section
+_WAVE_Y = _CENTER_Y + 200
+_WAVE_WIDTH = 600
+_WAVE_START_X = _CENTER_X - _WAVE_WIDTH // 2
+
+
+def _wave_geometry():
+    """Return the waveform polyline and its reflection"""
+    num_points = 200
+    i = np.arange(num_points)
+    xs = _WAVE_START_X + (_WAVE_WIDTH * i) / (num_points - 1)
+    # Create a complex waveform with multiple frequencies
+    t = i / num_points * 8 * np.pi
+    amplitude = 40 * (np.sin(t) * 0.5 + np.sin(t * 2.3) * 0.3 + np.sin(t * 0.7) * 0.2)
+    ys = _WAVE_Y + amplitude
+    reflected_ys = _WAVE_Y + (_WAVE_Y - ys) * 0.3  # Flip and scale down
+    return (tuple(zip(xs.tolist(), ys.tolist())),
+            tuple(zip(xs.tolist(), reflected_ys.tolist())))
+
+
+_WAVE_POINTS, _REFLECTION_POINTS = _wave_geometry()
+
+# Stylized music note in the top area
+_NOTE_X = _CENTER_X
+_NOTE_Y = _CENTER_Y - 280
+_NOTE_SIZE = 60
+# Note head (circle)
+_NOTE_HEAD = (_NOTE_X - _NOTE_SIZE // 3, _NOTE_Y - _NOTE_SIZE // 4,
+              _NOTE_X + _NOTE_SIZE // 3, _NOTE_Y + _NOTE_SIZE // 4)
+# Note stem (from top to bottom, so y0 < y1)
+_STEM_X = _NOTE_X + _NOTE_SIZE // 3 - 8
+_NOTE_STEM = (_STEM_X, _NOTE_Y - _NOTE_SIZE * 2, _STEM_X + 8,
+              _NOTE_Y - _NOTE_SIZE // 4)
+# Note flag
+_NOTE_FLAG = (
+    (_STEM_X + 8, _NOTE_Y - _NOTE_SIZE * 2),
+    (_STEM_X + 40, _NOTE_Y - _NOTE_SIZE * 1.5),
+    (_STEM_X + 35, _NOTE_Y - _NOTE_SIZE * 1.2),
+    (_STEM_X + 8, _NOTE_Y - _NOTE_SIZE * 1.4),
+)
 
 
 def create_icon():
     """Create a modern icon for Music Visualizer"""
 
-    # Create high-resolution image for icon (1024x1024 for macOS)
-    size = 1024
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    img = Image.new('RGBA', (ICON_SIZE, ICON_SIZE), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
 
-    # Background with rounded corners and modern gradient
-    margin = 80
-    bg_rect = [margin, margin, size - margin, size - margin]
-
     # Draw rounded rectangle background with dark music-themed color
-    corner_radius = 120
-    # Dark gradient from purple-blue to deep blue
-    draw.rounded_rectangle(bg_rect, corner_radius,
+    draw.rounded_rectangle(_BG_RECT, _CORNER_RADIUS,
                            fill=(24, 31, 56, 255))  # Deep dark blue
-
-    # Add subtle border with audio-themed accent
-    border_margin = margin - 10
-    border_rect = [
-        border_margin, border_margin, size - border_margin,
-        size - border_margin
-    ]
-    draw.rounded_rectangle(border_rect,
-                           corner_radius + 10,
+    draw.rounded_rectangle(_BORDER_RECT,
+                           _CORNER_RADIUS + 10,
                            outline=(102, 204, 255, 120),  # Cyan accent
                            width=8)
 
-    # Draw audio spectrum analyzer bars
-    center_x = size // 2
-    center_y = size // 2
-    
-    # Spectrum bars configuration
-    num_bars = 24
-    bar_width = 20
-    max_height = 300
-    spacing = 8
-    total_width = num_bars * bar_width + (num_bars - 1) * spacing
-    start_x = center_x - total_width // 2
-
-    # Create spectrum bars with varying heights
-    bar_heights = []
-    for i in range(num_bars):
-        # Create a realistic spectrum curve (higher in middle, lower on sides)
-        normalized_pos = abs(i - num_bars / 2) / (num_bars / 2)
-        base_height = max_height * (0.3 + 0.7 * (1 - normalized_pos * 0.8))
-        # Add some variation
-        variation = 0.2 + 0.8 * (math.sin(i * 0.8) * 0.5 + 0.5)
-        final_height = base_height * variation
-        bar_heights.append(final_height)
-
-    # Draw spectrum bars with gradient colors
-    for i, height in enumerate(bar_heights):
-        x = start_x + i * (bar_width + spacing)
-        y_top = center_y - height // 2
-        y_bottom = center_y + height // 2
-        
-        # Color gradient from cyan to magenta based on height
-        height_ratio = height / max_height
-        if height_ratio > 0.7:
-            color = (255, 64, 255, 255)  # Magenta for high frequencies
-        elif height_ratio > 0.4:
-            color = (64, 255, 255, 255)  # Cyan for mid frequencies  
-        else:
-            color = (64, 255, 128, 255)  # Green for low frequencies
-            
-        # Draw bar with rounded corners
-        draw.rounded_rectangle([x, y_top, x + bar_width, y_bottom], 
-                              bar_width // 4, fill=color)
-        
-        # Add glow effect
-        glow_margin = 3
-        glow_color = (*color[:3], 60)  # Same color but transparent
-        draw.rounded_rectangle([x - glow_margin, y_top - glow_margin, 
-                               x + bar_width + glow_margin, y_bottom + glow_margin], 
-                              bar_width // 3, outline=glow_color, width=2)
-
-    # Draw waveform in the bottom section
-    wave_y = center_y + 200
-    wave_width = 600
-    wave_start_x = center_x - wave_width // 2
-    wave_end_x = center_x + wave_width // 2
-    
-    # Generate smooth waveform points
-    wave_points = []
-    num_points = 200
-    for i in range(num_points):
-        x = wave_start_x + (wave_width * i) / (num_points - 1)
-        # Create a complex waveform with multiple frequencies
-        t = i / num_points * 8 * math.pi
-        amplitude = 40 * (math.sin(t) * 0.5 + math.sin(t * 2.3) * 0.3 + math.sin(t * 0.7) * 0.2)
-        y = wave_y + amplitude
-        wave_points.append((x, y))
-    
-    # Draw waveform with thick line
-    for i in range(len(wave_points) - 1):
-        draw.line([wave_points[i], wave_points[i + 1]], 
-                 fill=(255, 255, 255, 200), width=6)
-    
-    # Add a subtle reflection of the waveform
-    reflection_points = []
-    for x, y in wave_points:
-        reflected_y = wave_y + (wave_y - y) * 0.3  # Flip and scale down
-        reflection_points.append((x, reflected_y))
-    
-    for i in range(len(reflection_points) - 1):
-        draw.line([reflection_points[i], reflection_points[i + 1]], 
-                 fill=(255, 255, 255, 80), width=4)
-
-    # Add a music note symbol in the top area
-    note_x = center_x
-    note_y = center_y - 280
-    note_size = 60
-    
-    # Draw a stylized music note
-    # Note head (circle)
-    draw.ellipse([note_x - note_size//3, note_y - note_size//4, 
-                  note_x + note_size//3, note_y + note_size//4], 
-                 fill=(255, 255, 255, 255))
-    
-    # Note stem (draw from top to bottom, so y0 < y1)
-    stem_x = note_x + note_size//3 - 8
-    stem_top = note_y - note_size*2
-    stem_bottom = note_y - note_size//4
-    draw.rectangle([stem_x, stem_top, stem_x + 8, stem_bottom], 
-                   fill=(255, 255, 255, 255))
-    
-    # Note flag
-    flag_points = [
-        (stem_x + 8, note_y - note_size*2),
-        (stem_x + 40, note_y - note_size*1.5),
-        (stem_x + 35, note_y - note_size*1.2),
-        (stem_x + 8, note_y - note_size*1.4)
-    ]
-    draw.polygon(flag_points, fill=(255, 255, 255, 255))
+    # Draw spectrum bars with gradient colors onto their own layer so the
+    # glow can be produced from it with a single blur
+    bars_layer = Image.new('RGBA', (ICON_SIZE, ICON_SIZE), (0, 0, 0, 0))
+    stencil = _bar_stencil()
+    for (x0, y0, _, y1), color in _BARS:
+        # Paste a solid bar through the rounded-corner stencil
+        top = int(round(y0))
+        box = (int(x0), top, int(x0) + stencil.width, int(round(y1)) + 1)
+        bars_layer.paste(color, box, _bar_mask(stencil, box[3] - top))
+
+    # Add glow effect: blurred, mostly transparent copy beneath the bars
+    glow_alpha = 60
+    glow = bars_layer.filter(ImageFilter.GaussianBlur(radius=6))
+    glow.putalpha(glow.getchannel('A').point(lambda a: a * glow_alpha // 255))
+    img.alpha_composite(glow)
+    img.alpha_composite(bars_layer)
+
+    # Draw waveform with thick line and a subtle reflection
+    draw.line(_WAVE_POINTS, fill=(255, 255, 255, 200), width=6, joint="curve")
+    draw.line(_REFLECTION_POINTS, fill=(255, 255, 255, 80), width=4,
+              joint="curve")
+
+    # Draw the music note
+    draw.ellipse(_NOTE_HEAD, fill=(255, 255, 255, 255))
+    draw.rectangle(_NOTE_STEM, fill=(255, 255, 255, 255))
+    draw.polygon(_NOTE_FLAG, fill=(255, 255, 255, 255))
 
     return img
 
 
-def create_icon_set():
+def _save_png(job):
+    """Save an (image, filename, compress_level) job as PNG in a worker"""
+    image, filename, compress_level = job
+    image.save(filename, "PNG", compress_level=compress_level, optimize=False)
+    return filename
+
+
+class _InlineExecutor:
+    """Executor stand-in that runs each job immediately in this process
+
+    Used when only one CPU is available, where starting worker processes
+    and pickling images to them costs more than it saves.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def _encode_executor():
+    """Return a process pool for PNG encoding, or an inline executor"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        cpus = os.cpu_count() or 1
+    if cpus < 2:
+        return _InlineExecutor()
+    return ProcessPoolExecutor(max_workers=cpus)
+
+
+def load_cached_icon(path=BASE_ICON_PATH):
+    """Return the previously generated base icon, or None if it is stale"""
+    if not os.path.exists(path):
+        return None
+    if os.path.getmtime(path) < os.path.getmtime(os.path.abspath(__file__)):
+        return None
+
+    with Image.open(path) as cached:
+        if cached.size != (ICON_SIZE, ICON_SIZE):
+            return None
+        return cached.convert('RGBA')
+
+
+def create_icon_set(force=False):
     """Create a complete icon set for macOS"""
 
-    base_icon = create_icon()
+    # Pillow-SIMD reports versions like "9.5.0.post1"
+    print(f"Using Pillow {PIL.__version__}")
+
+    # create_icon() is deterministic, so reuse the base icon from a previous
+    # run unless this script has changed since
+    base_icon = None if force else load_cached_icon()
+    reused_base_icon = base_icon is not None
+    if reused_base_icon:
+        print(f"Reusing cached {BASE_ICON_PATH} (pass --force to regenerate)")
+    else:
+        base_icon = create_icon()
 
     # Icon sizes for macOS
     sizes = [16, 32, 64, 128, 256, 512, 1024]
@@ -161,30 +266,61 @@ def create_icon_set():
     if not os.path.exists("icons"):
         os.makedirs("icons")
 
-    for size in sizes:
-        # Resize image with high quality
-        resized = base_icon.resize((size, size), Image.Resampling.LANCZOS)
+    # Create ICO file for cross-platform compatibility (built below)
+    ico_sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128),
+                 (256, 256)]
+    ico_widths = {width for width, _ in ico_sizes}
 
-        # Save as PNG
-        filename = f"icons/music_visualizer_{size}x{size}.png"
-        resized.save(filename, "PNG")
-        print(f"Created {filename}")
+    # Downsample as a pyramid (largest size first), so each Lanczos pass
+    # works from the previous result instead of the full 1024x1024 source.
+    # Each size is handed to the encoder as soon as it exists and only the
+    # ICO sizes are kept, so large intermediates are released promptly.
+    # PNG encoding is independent per file, so run it across processes
+    # when there is more than one CPU to use.
+    with _encode_executor() as executor:
+        pending = []
+        if not reused_base_icon:
+            # Save the main icon
+            pending.append(
+                executor.submit(_save_png, (base_icon, BASE_ICON_PATH, 9)))
 
-    # Save the main icon
-    base_icon.save("icons/music_visualizer.png", "PNG")
-    print("Created icons/music_visualizer.png")
+        current = base_icon
+        resized_cache = {}
+        for size in sorted(sizes, reverse=True):
+            while current.width > 2 * size:
+                current = current.resize(
+                    (current.width // 2, current.height // 2),
+                    Image.Resampling.LANCZOS)
 
-    # Create ICO file for cross-platform compatibility
-    ico_sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128),
-                 (256, 256)]
-    ico_images = []
+            # Resize image with high quality
+            if current.size != (size, size):
+                current = current.resize((size, size),
+                                         Image.Resampling.LANCZOS)
 
-    for size in ico_sizes:
-        resized = base_icon.resize(size, Image.Resampling.LANCZOS)
-        ico_images.append(resized)
+            if size in ico_widths:
+                resized_cache[size] = current
+            # Sized icons are tiny; fast deflate matters more than a few bytes
+            pending.append(
+                executor.submit(
+                    _save_png,
+                    (current, f"icons/music_visualizer_{size}x{size}.png", 1)))
+        del current
+
+        for future in pending:
+            print(f"Created {future.result()}")
+
+    # Reuse the pyramid outputs; only sizes not in the PNG set are resized
+    ico_images = [
+        resized_cache[width] if width in resized_cache else
+        base_icon.resize((width, height), Image.Resampling.LANCZOS)
+        for width, height in ico_sizes
+    ]
 
     # Save as ICO
-    ico_images[0].save("icons/music_visualizer.ico", format="ICO", sizes=ico_sizes)
+    # Save from the largest frame and pass the others via append_images so
+    # Pillow uses them as-is instead of resampling each size again
+    ico_images[-1].save("icons/music_visualizer.ico", format="ICO",
+                        sizes=ico_sizes, append_images=ico_images[:-1])
     print("Created icons/music_visualizer.ico")
 
     print("\n🎵 Music Visualizer icon set created successfully!")
@@ -198,4 +334,10 @@ def create_icon_set():
 
 
 if __name__ == "__main__":
-    create_icon_set()
+    parser = argparse.ArgumentParser(
+        description="Generate the Music Visualizer icon set")
+    parser.add_argument("--force",
+                        action="store_true",
+                        help="regenerate the base icon even if it is cached")
+    args = parser.parse_args()
+    create_icon_set(force=args.force)
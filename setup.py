@@ -4,15 +4,29 @@ Setup script for Music Visualizer.
 """
 
 import os
+import re
+import sys
 from pathlib import Path
 from setuptools import setup, find_packages
 
-# Read the contents of README file
 this_directory = Path(__file__).parent
-try:
-    long_description = (this_directory / "README.md").read_text(encoding='utf-8')
-except FileNotFoundError:
-    long_description = "A wxPython-based music visualization application with real-time audio analysis and multiple visualization modes."
+
+# Commands that publish the long description; everything else (egg_info,
+# --version, develop, ...) skips reading the README
+LONG_DESCRIPTION_COMMANDS = {'sdist', 'bdist_wheel', 'upload', 'check'}
+
+
+# Read the contents of README file
+def read_long_description():
+    """Read README.md, but only for commands that actually need it."""
+
+    if not LONG_DESCRIPTION_COMMANDS.intersection(sys.argv[1:]):
+        return ""
+    try:
+        with open(this_directory / "README.md", 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return "A wxPython-based music visualization application with real-time audio analysis and multiple visualization modes."
 
 
 # Read requirements
@@ -32,17 +46,24 @@ def read_requirements(filename):
     return []
 
 
+_VERSION_RE = re.compile(r"__version__\s*=\s*['\"]([^'\"]*)['\"]")
+_version = None
+
+
 # Read version from the package __init__.py in src layout
 def get_version():
-    """Extract version from src/music_visualizer/__init__.py."""
-    version_file = this_directory / "src" / "music_visualizer" / "__init__.py"
-    if version_file.exists():
-        import re
-        content = version_file.read_text(encoding='utf-8')
-        version_match = re.search(r"__version__\s*=\s*['\"]([^'\"]*)['\"]", content)
-        if version_match:
-            return version_match.group(1)
-    return "1.0.0"
+    """Extract version from src/music_visualizer/__init__.py (cached)."""
+    global _version
+
+    if _version is None:
+        _version = "1.0.0"
+        version_file = this_directory / "src" / "music_visualizer" / "__init__.py"
+        if version_file.exists():
+            version_match = _VERSION_RE.search(
+                version_file.read_text(encoding='utf-8'))
+            if version_match:
+                _version = version_match.group(1)
+    return _version
 
 setup(
     name="music-visualizer",
@@ -50,7 +71,7 @@ setup(
     author="Music Visualizer Developer",
     author_email="developer@musicvisualizer.com",
     description="A wxPython-based music visualization application with real-time audio analysis",
-    long_description=long_description,
+    long_description=read_long_description(),
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/music-visualizer",
     project_urls={
@@ -87,6 +108,14 @@ setup(
     extras_require={
         "dev": read_requirements("requirements-dev.txt"),
         "audio": ["librosa>=0.9.0", "soundfile>=0.10.0"],
+        # Icon generation (scripts/create_icon.py); Pillow-SIMD is a drop-in
+        # replacement and may be installed instead for faster resizing
+        "icons": ["Pillow>=9.1.0"],
+        # JIT-compiled visualizer and Music Maker kernels (NumPy/pure Python
+        # fallback otherwise)
+        "jit": ["numba>=0.56.0"],
+        # Faster Music Maker project save/load (stdlib json otherwise)
+        "fast-json": ["orjson>=3.6.0"],
     },
     entry_points={
         "console_scripts": [
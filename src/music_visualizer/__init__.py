@@ -14,57 +14,9 @@ __author__ = "Music Visualizer Developer"
 __email__ = "developer@musicvisualizer.com"
 __license__ = "MIT"
 
-# Lazy import to avoid circular import issues
-_classes_imported = False
-AudioVisualizer = None
-MusicVisualizerFrame = None
-MusicVisualizerApp = None
-
-def _ensure_imports():
-    """Ensure classes are imported when needed."""
-    global _classes_imported, AudioVisualizer, MusicVisualizerFrame, MusicVisualizerApp
-    
-    if not _classes_imported:
-        # Try different import strategies for robustness
-        try:
-            # Strategy 1: Relative import (when used as package)
-            from .music_visualizer import (
-                AudioVisualizer as _AudioVisualizer,
-                MusicVisualizerFrame as _MusicVisualizerFrame,
-                MusicVisualizerApp as _MusicVisualizerApp
-            )
-        except (ImportError, SystemError, ValueError):
-            # Strategy 2: Absolute import (when running as script)
-            try:
-                from music_visualizer.music_visualizer import (
-                    AudioVisualizer as _AudioVisualizer,
-                    MusicVisualizerFrame as _MusicVisualizerFrame,
-                    MusicVisualizerApp as _MusicVisualizerApp
-                )
-            except ImportError:
-                # Strategy 3: Direct file import
-                import sys
-                import os
-                import importlib.util
-                
-                current_dir = os.path.dirname(os.path.abspath(__file__))
-                music_viz_path = os.path.join(current_dir, 'music_visualizer.py')
-                
-                if os.path.exists(music_viz_path):
-                    spec = importlib.util.spec_from_file_location("music_visualizer_module", music_viz_path)
-                    music_viz_module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(music_viz_module)
-                    
-                    _AudioVisualizer = music_viz_module.AudioVisualizer
-                    _MusicVisualizerFrame = music_viz_module.MusicVisualizerFrame
-                    _MusicVisualizerApp = music_viz_module.MusicVisualizerApp
-                else:
-                    raise ImportError("Could not locate music_visualizer.py file")
-        
-        AudioVisualizer = _AudioVisualizer
-        MusicVisualizerFrame = _MusicVisualizerFrame
-        MusicVisualizerApp = _MusicVisualizerApp
-        _classes_imported = True
+# The GUI classes are imported lazily so that importing the package does
+# not pull in wxPython
+_LAZY_CLASSES = ('AudioVisualizer', 'MusicVisualizerFrame', 'MusicVisualizerApp')
 
 # Define what gets imported with "from music_visualizer import *"
 __all__ = [
@@ -82,18 +34,17 @@ def main():
     This function creates and runs the wxPython application.
     Can be called from command line via: python -m music_visualizer
     """
-    _ensure_imports()
+    from .music_visualizer import MusicVisualizerApp
+
     app = MusicVisualizerApp()
     app.MainLoop()
 
-# Module-level getattr to support dynamic imports
+# Module-level getattr to support lazy imports (PEP 562)
 def __getattr__(name):
-    """Support for dynamic attribute access."""
-    if name in ('AudioVisualizer', 'MusicVisualizerFrame', 'MusicVisualizerApp'):
-        _ensure_imports()
-        return globals()[name]
+    """Import the GUI classes on first access."""
+    if name in _LAZY_CLASSES:
+        from . import music_visualizer as _module
+        value = getattr(_module, name)
+        globals()[name] = value
+        return value
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
-
-# Compatibility with direct module execution
-if __name__ == "__main__":
-    main()
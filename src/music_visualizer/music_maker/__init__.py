@@ -8,13 +8,11 @@ with a visual interface integrated into the Music Visualizer application.
 __version__ = "1.0.0"
 __author__ = "Music Visualizer Developer"
 
-# Import main classes for easy access
-from .music_maker import (
-    Note,
-    Track,
-    MusicMakerFrame,
-    MusicMakerApp
-)
+# Import the data model eagerly; the GUI classes (and wxPython) are only
+# imported on first access via __getattr__ below
+from .core import Note, Track
+
+_LAZY_CLASSES = ('MusicMakerFrame', 'MusicMakerApp')
 
 # Define what gets imported with "from music_visualizer.music_maker import *"
 __all__ = [
@@ -33,6 +31,8 @@ def main():
     Creates and runs the Music Maker wxPython application.
     Can be called from the main visualizer or standalone.
     """
+    from .music_maker import MusicMakerApp
+
     app = MusicMakerApp()
     app.MainLoop()
 
@@ -46,6 +46,7 @@ def launch_music_maker():
         MusicMakerFrame: The created music maker window
     """
     import wx
+    from .music_maker import MusicMakerFrame
     
     # Check if there's already a wx.App running
     app = wx.GetApp()
@@ -67,6 +68,17 @@ def launch_music_maker():
     return frame
 
 
+# Module-level getattr to support lazy imports (PEP 562)
+def __getattr__(name):
+    """Import the GUI classes on first access."""
+    if name in _LAZY_CLASSES:
+        from . import music_maker as _module
+        value = getattr(_module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
 # Compatibility with direct module execution
 if __name__ == "__main__":
     main()
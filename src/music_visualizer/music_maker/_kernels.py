@@ -0,0 +1,69 @@
+"""
+Numeric kernels for Music Maker.
+
+These are compiled with Numba when it is installed (``pip install
+music-visualizer[jit]``); otherwise the same functions run as plain Python.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def snap_batch(midi_notes, key_root, scale):
+    """Snap each MIDI note to the nearest degree of a scale
+
+    ``midi_notes`` and ``scale`` are int64 arrays; ``scale`` holds the
+    scale degrees as semitone offsets from ``key_root``.
+    """
+    snapped = np.empty_like(midi_notes)
+    for i in range(midi_notes.shape[0]):
+        offset = midi_notes[i] - key_root
+        note_in_octave = offset % 12
+
+        # Find closest note in scale
+        closest_distance = 12
+        closest_note = note_in_octave
+        for j in range(scale.shape[0]):
+            distance = abs(note_in_octave - scale[j])
+            if distance < closest_distance:
+                closest_distance = distance
+                closest_note = scale[j]
+
+        snapped[i] = key_root + (offset // 12) * 12 + closest_note
+    return snapped
+
+
+@njit(cache=True)
+def build_chord_arrays(roots, qualities, intervals, counts, chord_duration):
+    """Expand a chord progression into note pitch and start arrays
+
+    Chord ``i`` starts at ``i * chord_duration`` and uses the first
+    ``counts[qualities[i]]`` entries of row ``qualities[i]`` of
+    ``intervals`` as semitone offsets from ``roots[i]``.
+    """
+    total = 0
+    for i in range(roots.shape[0]):
+        total += counts[qualities[i]]
+
+    pitches = np.empty(total, dtype=np.int64)
+    start_times = np.empty(total, dtype=np.float64)
+    n = 0
+    for i in range(roots.shape[0]):
+        quality = qualities[i]
+        for j in range(counts[quality]):
+            pitches[n] = roots[i] + intervals[quality, j]
+            start_times[n] = i * chord_duration
+            n += 1
+    return pitches, start_times
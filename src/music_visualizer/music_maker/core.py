@@ -0,0 +1,239 @@
+"""
+Core data model for Music Maker.
+
+Notes, tracks and projects live here, separate from the GUI, so they can be
+imported without pulling in wxPython or matplotlib.
+"""
+
+import numpy as np
+
+
+class Note:
+
+    def __init__(self, pitch, duration, start_time, velocity=80):
+        self.pitch = pitch  # MIDI note number
+        self.duration = duration  # In beats
+        self.start_time = start_time  # In beats
+        self.velocity = velocity  # 0-127
+
+    def __repr__(self):
+        return f"Note(pitch={self.pitch}, duration={self.duration}, start={self.start_time})"
+
+
+class Track:
+    """A sequence of notes played on one instrument.
+
+    Notes are stored as parallel NumPy arrays (pitch, start, duration,
+    velocity) rather than a list of Note objects, so range queries, hit
+    tests and redraws work on whole columns at once. ``notes`` still returns
+    Note objects for callers that want them; those are copies, so edits go
+    through the Track methods.
+
+    The arrays are kept sorted by start time, so range queries binary-search
+    a candidate window instead of scanning every note. Indices returned by
+    queries are only valid until the next edit.
+    """
+
+    _INITIAL_CAPACITY = 16
+    # Resolution of the (pitch, start) cell index, in cells per beat
+    CELLS_PER_BEAT = 16
+
+    def __init__(self, name="Track", instrument=0, channel=0):
+        self.name = name
+        self.instrument = instrument
+        self.channel = channel
+        self.volume = 80
+        self.muted = False
+        self.solo = False
+
+        self._pitch = np.empty(self._INITIAL_CAPACITY, dtype=np.int16)
+        self._start = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._duration = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._velocity = np.empty(self._INITIAL_CAPACITY, dtype=np.uint8)
+        self._size = 0
+        # Upper bound on note duration, used to widen range query windows
+        self._max_duration = 0.0
+
+        # (pitch, start in sixteenths) -> number of notes in that cell, for
+        # O(1) duplicate checks when placing notes
+        self._cell_index = {}
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        # A track exists even without notes; keep ``if track:`` checks
+        # meaning "is there a track" rather than "does it have notes"
+        return True
+
+    @property
+    def pitches(self):
+        return self._pitch[:self._size]
+
+    @property
+    def start_times(self):
+        return self._start[:self._size]
+
+    @property
+    def durations(self):
+        return self._duration[:self._size]
+
+    @property
+    def velocities(self):
+        return self._velocity[:self._size]
+
+    @property
+    def notes(self):
+        return [
+            Note(pitch, duration, start_time, velocity)
+            for pitch, duration, start_time, velocity in zip(
+                self.pitches.tolist(), self.durations.tolist(),
+                self.start_times.tolist(), self.velocities.tolist())
+        ]
+
+    def note_at(self, index):
+        """Return a Note copy of the note stored at index"""
+        return Note(int(self._pitch[index]), float(self._duration[index]),
+                    float(self._start[index]), int(self._velocity[index]))
+
+    def _grow(self):
+        """Double the capacity of the note arrays"""
+        capacity = 2 * len(self._pitch)
+        for attr in ('_pitch', '_start', '_duration', '_velocity'):
+            old = getattr(self, attr)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, attr, new)
+
+    def _cell_key(self, pitch, start_time):
+        return (int(pitch), int(round(start_time * self.CELLS_PER_BEAT)))
+
+    def _index_cells(self, pitches, start_times, delta):
+        cell_index = self._cell_index
+        for key in zip(pitches.tolist(),
+                       np.rint(start_times * self.CELLS_PER_BEAT).astype(
+                           np.int64).tolist()):
+            count = cell_index.get(key, 0) + delta
+            if count > 0:
+                cell_index[key] = count
+            else:
+                cell_index.pop(key, None)
+
+    def has_note_at(self, pitch, start_time):
+        """Whether a note of this pitch starts in the same grid cell"""
+        return self._cell_key(pitch, start_time) in self._cell_index
+
+    def add_note(self, note):
+        if self._size == len(self._pitch):
+            self._grow()
+        n = self._size
+        i = int(np.searchsorted(self.start_times, note.start_time,
+                                side='right'))
+        for column, value in ((self._pitch, note.pitch),
+                              (self._start, note.start_time),
+                              (self._duration, note.duration),
+                              (self._velocity, note.velocity)):
+            column[i + 1:n + 1] = column[i:n]
+            column[i] = value
+        self._size += 1
+        self._max_duration = max(self._max_duration, note.duration)
+
+        key = self._cell_key(note.pitch, note.start_time)
+        self._cell_index[key] = self._cell_index.get(key, 0) + 1
+
+    def add_notes(self, pitches, durations, start_times, velocity=80):
+        """Add many notes at once from parallel arrays"""
+        pitches = np.asarray(pitches)
+        count = len(pitches)
+        if not count:
+            return
+        durations = np.broadcast_to(durations, count)
+        start_times = np.broadcast_to(start_times, count)
+        velocities = np.broadcast_to(velocity, count)
+
+        while self._size + count > len(self._pitch):
+            self._grow()
+        n = self._size
+        total = n + count
+        order = np.argsort(
+            np.concatenate([self.start_times, start_times]), kind='stable')
+        for attr, values in (('_pitch', pitches), ('_start', start_times),
+                             ('_duration', durations),
+                             ('_velocity', velocities)):
+            column = getattr(self, attr)
+            column[n:total] = values
+            column[:total] = column[:total][order]
+        self._size = total
+        self._max_duration = max(self._max_duration, float(durations.max()))
+        self._index_cells(pitches, start_times, 1)
+
+    def remove_note(self, note):
+        matches = np.nonzero((self.pitches == note.pitch)
+                             & (self.start_times == note.start_time)
+                             & (self.durations == note.duration))[0]
+        if len(matches):
+            self.remove_notes(matches[:1])
+
+    def remove_notes(self, indices):
+        """Remove the notes at the given indices"""
+        keep = np.ones(self._size, dtype=bool)
+        keep[indices] = False
+        self._index_cells(self.pitches[~keep], self.start_times[~keep], -1)
+        count = int(keep.sum())
+        for attr in ('_pitch', '_start', '_duration', '_velocity'):
+            column = getattr(self, attr)
+            column[:count] = column[:self._size][keep]
+        self._size = count
+
+    def clear(self):
+        self._size = 0
+        self._max_duration = 0.0
+        self._cell_index.clear()
+
+    def set_start_times(self, start_times):
+        """Move every note to the given start times (in storage order)"""
+        self._index_cells(self.pitches, self.start_times, -1)
+        self.start_times[:] = start_times
+        self._index_cells(self.pitches, self.start_times, 1)
+
+        order = np.argsort(self.start_times, kind='stable')
+        for attr in ('_pitch', '_start', '_duration', '_velocity'):
+            column = getattr(self, attr)
+            column[:self._size] = column[:self._size][order]
+
+    def find_notes_near(self, time, pitch, time_tolerance, pitch_tolerance):
+        """Return indices of notes starting within the given tolerances"""
+        mask = ((np.abs(self.start_times - time) < time_tolerance)
+                & (np.abs(self.pitches - pitch) < pitch_tolerance))
+        return np.nonzero(mask)[0]
+
+    def get_notes_in_range(self, start_time, end_time):
+        """Return indices of notes sounding anywhere in [start_time, end_time)
+
+        Index the column properties (or use note_at) with the result.
+        """
+        starts = self.start_times
+        # Nothing starting before start_time - _max_duration can still sound
+        lo = int(np.searchsorted(starts, start_time - self._max_duration,
+                                 side='right'))
+        hi = int(np.searchsorted(starts, end_time, side='left'))
+        ends = starts[lo:hi] + self._duration[lo:hi]
+        return lo + np.nonzero(ends > start_time)[0]
+
+
+class MusicProject:
+
+    def __init__(self):
+        self.tracks = []
+        self.tempo = 120  # BPM
+        self.time_signature = (4, 4)  # (numerator, denominator)
+        self.key = "C"
+        self.length = 16  # bars
+        self.project_name = "Untitled"
+
+    def add_track(self, track):
+        self.tracks.append(track)
+
+    def remove_track(self, track):
+        if track in self.tracks:
+            self.tracks.remove(track)
@@ -1,73 +1,127 @@
 import wx
 import numpy as np
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_wxagg import FigureCanvasWxAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
 try:
     import pygame
     PYGAME_AVAILABLE = True
 except ImportError:
     PYGAME_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+import bisect
+import collections
+import queue
+import re
 import threading
 import time
 import json
 import os
 
-
-class Note:
-
-    def __init__(self, pitch, duration, start_time, velocity=80):
-        self.pitch = pitch  # MIDI note number
-        self.duration = duration  # In beats
-        self.start_time = start_time  # In beats
-        self.velocity = velocity  # 0-127
-
-    def __repr__(self):
-        return f"Note(pitch={self.pitch}, duration={self.duration}, start={self.start_time})"
-
-
-class Track:
-
-    def __init__(self, name="Track", instrument=0, channel=0):
-        self.name = name
-        self.instrument = instrument
-        self.channel = channel
-        self.notes = []
-        self.volume = 80
-        self.muted = False
-        self.solo = False
-
-    def add_note(self, note):
-        self.notes.append(note)
-
-    def remove_note(self, note):
-        if note in self.notes:
-            self.notes.remove(note)
-
-    def get_notes_in_range(self, start_time, end_time):
-        return [
-            note for note in self.notes
-            if note.start_time < end_time and note.start_time +
-            note.duration > start_time
-        ]
-
-
-class MusicProject:
-
-    def __init__(self):
-        self.tracks = []
-        self.tempo = 120  # BPM
-        self.time_signature = (4, 4)  # (numerator, denominator)
-        self.key = "C"
-        self.length = 16  # bars
-        self.project_name = "Untitled"
-
-    def add_track(self, track):
-        self.tracks.append(track)
-
-    def remove_track(self, track):
-        if track in self.tracks:
-            self.tracks.remove(track)
+from .core import Note, Track, MusicProject
+from ._kernels import build_chord_arrays, snap_batch
+
+# Playback scheduling, in monotonic-clock nanoseconds unless noted
+SCHEDULE_LOOKAHEAD_NS = 50_000_000
+SPIN_WAIT_NS = 2_000_000
+PLAYBACK_TICK_NS = 5_000_000
+# GUI refresh of the position label and cursor while playing, in ms
+POSITION_REFRESH_MS = 33
+
+# Chord symbols: root (letter plus optional accidental) and quality suffix
+CHORD_RE = re.compile(r'^([A-G][#b]?)(.*)$')
+# Root name -> MIDI number in the octave starting at C4
+CHORD_ROOTS = {
+    letter + accidental: 60 + (pc + shift) % 12
+    for letter, pc in (('C', 0), ('D', 2), ('E', 4), ('F', 5), ('G', 7),
+                       ('A', 9), ('B', 11))
+    for accidental, shift in (('', 0), ('#', 1), ('b', -1))
+}
+CHORD_INTERVALS = {
+    '': (0, 4, 7),
+    'm': (0, 3, 7),
+    'dim': (0, 3, 6),
+    'aug': (0, 4, 8),
+    'sus2': (0, 2, 7),
+    'sus4': (0, 5, 7),
+    '7': (0, 4, 7, 10),
+    'm7': (0, 3, 7, 10),
+    'maj7': (0, 4, 7, 11),
+}
+
+# Loudest preview note, as a fraction of full scale; velocity scales below it
+NOTE_PEAK_VOLUME = 0.3
+# Pitches rendered ahead of time when the audio thread starts
+PREWARM_PITCHES = range(36, 97)
+# Mixer channels reserved for note playback
+NOTE_CHANNELS = 64
+# One sine period pre-scaled to the preview peak, so synthesis is a gather
+# straight into int16; table size must be a power of two
+SINE_TABLE_SIZE = 4096
+SINE_TABLE = (32767 * NOTE_PEAK_VOLUME * np.sin(
+    2 * np.pi * np.arange(SINE_TABLE_SIZE) / SINE_TABLE_SIZE)).astype(np.int16)
+
+
+def dumps_project(data):
+    """Encode project data as compact JSON bytes (orjson if installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def loads_project(raw):
+    """Decode project JSON bytes (orjson if installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _open_object(data):
+    """Encode a dict as JSON with its closing brace left off"""
+    return dumps_project(data)[:-1].decode('utf-8')
+
+
+def write_project(f, project):
+    """Stream project JSON to a text file, one note record at a time
+
+    Produces the same document loads_project reads, but notes are formatted
+    straight from the track columns instead of first building a nested
+    dict of every note.
+    """
+    f.write(
+        _open_object({
+            'name': project.project_name,
+            'tempo': project.tempo,
+            'time_signature': list(project.time_signature),
+            'key': project.key,
+            'length': project.length,
+        }))
+    f.write(',"tracks":[')
+    for i, track in enumerate(project.tracks):
+        if i:
+            f.write(',')
+        f.write(
+            _open_object({
+                'name': track.name,
+                'instrument': track.instrument,
+                'volume': track.volume,
+            }))
+        f.write(',"notes":[')
+        # repr() of a finite float is its shortest round-trip form, which
+        # is also valid JSON
+        f.writelines(
+            f'{"," if j else ""}{{"pitch":{pitch},"duration":{duration!r},'
+            f'"start_time":{start_time!r},"velocity":{velocity}}}'
+            for j, (pitch, duration, start_time, velocity) in enumerate(
+                zip(track.pitches.tolist(), track.durations.tolist(),
+                    track.start_times.tolist(), track.velocities.tolist())))
+        f.write(']}')
+    f.write(']}')
 
 
 class MusicMakerFrame(wx.Frame):
@@ -80,11 +134,22 @@ class MusicMakerFrame(wx.Frame):
         self.is_playing = False
         self.playback_position = 0
         self.selected_notes = []
+        self._redraw_pending = False
+        self._last_hover_status = None
+        self._pending_status = None
+        self._last_position_label = "0:0:0"
+        self._note_event_updates = queue.SimpleQueue()
 
         # Music theory data
         self.note_names = [
             'C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B'
         ]
+        self._name_to_pc = {n: i for i, n in enumerate(self.note_names)}
+        self._midi_names = tuple(f"{self.note_names[i % 12]}{i // 12}"
+                                 for i in range(128))
+        # Black keys by pitch class, indexed with pitch % 12
+        self._sharp_mask = np.array([('#' in n) for n in self.note_names],
+                                    dtype=bool)
         self.scales = {
             'Major': [0, 2, 4, 5, 7, 9, 11],
             'Minor': [0, 2, 3, 5, 7, 8, 10],
@@ -93,20 +158,51 @@ class MusicMakerFrame(wx.Frame):
             'Dorian': [0, 2, 3, 5, 7, 9, 10],
             'Mixolydian': [0, 2, 4, 5, 7, 9, 10]
         }
+        # Chord interval table padded to a common width, plus the number of
+        # entries each quality actually uses
+        width = max(len(iv) for iv in CHORD_INTERVALS.values())
+        self._chord_quality_index = {
+            name: i for i, name in enumerate(CHORD_INTERVALS)
+        }
+        self._chord_intervals = np.zeros((len(CHORD_INTERVALS), width),
+                                         dtype=np.int64)
+        self._chord_interval_counts = np.array(
+            [len(iv) for iv in CHORD_INTERVALS.values()], dtype=np.int64)
+        for i, intervals in enumerate(CHORD_INTERVALS.values()):
+            self._chord_intervals[i, :len(intervals)] = intervals
+        self._scale_arrays = {
+            name: np.asarray(degrees, dtype=np.int64)
+            for name, degrees in self.scales.items()
+        }
 
-        # Initialize pygame mixer if available
+        # Initialize pygame mixer if available. Note previews are mono, so
+        # ask for a mono mixer with a small buffer; if the visualizer already
+        # opened the mixer, init is a no-op and we render to its format.
+        self._note_cache = {}  # MIDI pitch -> pygame Sound at peak volume
+        self._synth_buffers = None
         if PYGAME_AVAILABLE:
             try:
                 pygame.mixer.init(frequency=22050,
                                   size=-16,
-                                  channels=2,
-                                  buffer=512)
-                self.audio_enabled = True
+                                  channels=1,
+                                  buffer=256)
+                self._mixer_format = pygame.mixer.get_init()
+                self.audio_enabled = self._mixer_format is not None
+                # Fixed polyphony: notes take channels round-robin instead
+                # of letting Sound.play() search for (or steal) a free one
+                pygame.mixer.set_num_channels(NOTE_CHANNELS)
+                self._channels = [
+                    pygame.mixer.Channel(i) for i in range(NOTE_CHANNELS)
+                ]
+                self._channel_index = 0
             except:
                 self.audio_enabled = False
         else:
             self.audio_enabled = False
 
+        if self.audio_enabled:
+            self.start_audio_worker()
+
         self.init_ui()
         self.create_default_track()
 
@@ -170,6 +266,11 @@ class MusicMakerFrame(wx.Frame):
         transport_sizer.Add(self.position_text, 0,
                             wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
 
+        # The playback thread only stores its position; this timer polls it
+        # so formatting and widget updates stay on the GUI thread
+        self.position_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_position_timer, self.position_timer)
+
         transport_panel.SetSizer(transport_sizer)
         main_sizer.Add(transport_panel, 0, wx.ALL | wx.EXPAND, 5)
 
@@ -292,11 +393,83 @@ class MusicMakerFrame(wx.Frame):
         self.piano_roll_canvas = FigureCanvas(self.piano_roll_panel, -1,
                                               self.piano_roll_figure)
         self.piano_roll_canvas.Bind(wx.EVT_LEFT_DOWN, self.on_piano_roll_click)
-        self.piano_roll_canvas.Bind(wx.EVT_MOTION, self.on_piano_roll_motion)
+        self.piano_roll_canvas.Bind(wx.EVT_LEFT_UP, self.on_piano_roll_release)
         sizer.Add(self.piano_roll_canvas, 1, wx.ALL | wx.EXPAND, 5)
 
         self.piano_roll_panel.SetSizer(sizer)
 
+        self.setup_piano_roll_axes()
+
+        # Hover readout is polled instead of handling every EVT_MOTION;
+        # motion events are only bound while the left button is held
+        self._last_hover_pos = None
+        self._tracking_motion = False
+        self.hover_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_hover_timer, self.hover_timer)
+        self.hover_timer.Start(100)
+
+    def setup_piano_roll_axes(self):
+        """Create the persistent piano roll artists
+
+        The axes, note collection and playback cursor are created once and
+        then only updated, instead of clearing and rebuilding the figure on
+        every edit.
+        """
+        ax = self.piano_roll_figure.add_subplot(111)
+        self.piano_roll_ax = ax
+
+        # MIDI note range (show piano keys)
+        self.piano_roll_min_note = 36  # C2
+        self.piano_roll_max_note = 96  # C7
+        ax.set_ylim(self.piano_roll_min_note, self.piano_roll_max_note)
+
+        # Grid is drawn lazily by update_piano_roll (it depends on project length)
+        self._grid_key = None
+        self._grid_collections = []
+
+        self._note_collection = PolyCollection([],
+                                               facecolor='blue',
+                                               edgecolor='darkblue',
+                                               alpha=0.7)
+        ax.add_collection(self._note_collection)
+
+        # The cursor is animated: it is left out of full redraws and blitted
+        # over a cached background so moving it does not re-render the figure
+        self._cursor_line = ax.axvline(0,
+                                       color='red',
+                                       linewidth=2,
+                                       alpha=0.8,
+                                       visible=False,
+                                       animated=True)
+        self._cursor_background = None
+        self.piano_roll_canvas.mpl_connect('draw_event',
+                                           self.on_piano_roll_draw)
+
+        self._inv_transform = None
+        ax.callbacks.connect('xlim_changed',
+                             self.invalidate_piano_roll_transform)
+        ax.callbacks.connect('ylim_changed',
+                             self.invalidate_piano_roll_transform)
+
+        ax.set_xlabel('Time (beats)')
+        ax.set_ylabel('MIDI Note')
+
+        # Add note names on y-axis
+        note_ticks = []
+        note_labels = []
+        for octave in range(2, 8):  # C2 to C7
+            for i, note_name in enumerate(self.note_names):
+                if note_name in ['C', 'E',
+                                 'G']:  # Show only some notes to avoid clutter
+                    note_num = octave * 12 + i
+                    if (self.piano_roll_min_note <= note_num <=
+                            self.piano_roll_max_note):
+                        note_ticks.append(note_num)
+                        note_labels.append(f'{note_name}{octave}')
+
+        ax.set_yticks(note_ticks)
+        ax.set_yticklabels(note_labels)
+
     def setup_mixer_tab(self):
         sizer = wx.BoxSizer(wx.VERTICAL)
 
@@ -409,6 +582,12 @@ class MusicMakerFrame(wx.Frame):
 
         self.pattern_panel.SetSizer(sizer)
 
+        # Persistent axes; update_pattern_display only swaps the chord artists
+        self.pattern_ax = self.pattern_figure.add_subplot(111)
+        self.pattern_ax.set_ylim(0, 1)
+        self.pattern_ax.set_yticks([])
+        self._pattern_artists = []
+
     def create_mixer_strip(self, parent, name, is_master=False):
         strip_panel = wx.Panel(parent)
         strip_sizer = wx.BoxSizer(wx.VERTICAL)
@@ -503,7 +682,7 @@ class MusicMakerFrame(wx.Frame):
         self.project.add_track(track)
         self.current_track = track
         self.update_tracks_list()
-        self.update_piano_roll()
+        self.schedule_piano_roll_redraw()
 
     def update_tracks_list(self):
         """Update the tracks list display"""
@@ -515,88 +694,163 @@ class MusicMakerFrame(wx.Frame):
             index = self.project.tracks.index(self.current_track)
             self.tracks_list.SetSelection(index)
 
+    def schedule_piano_roll_redraw(self):
+        """Request a piano roll redraw, coalescing bursts of edits
+
+        Redraws requested within one ~16 ms frame of each other (e.g. while
+        dragging or during batch edits) result in a single update_piano_roll
+        call, so the roll repaints at most ~60 times a second.
+        """
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            wx.CallLater(16, self._do_piano_roll_redraw)
+
+    def _do_piano_roll_redraw(self):
+        self._redraw_pending = False
+        # Every edit path requests a redraw, so this is also where playback
+        # learns about edits (once per coalesced batch)
+        self.post_note_events()
+        self.update_piano_roll()
+
+    def set_status(self, text):
+        """Show text in the status bar, coalescing updates per event loop pass
+
+        Only the last text set before the event loop gets control again is
+        actually written to the native status bar.
+        """
+        if self._pending_status is None:
+            wx.CallAfter(self._flush_status)
+        self._pending_status = text
+
+    def _flush_status(self):
+        text, self._pending_status = self._pending_status, None
+        if text is not None:
+            self.status_bar.SetStatusText(text)
+
     def update_piano_roll(self):
         """Update the piano roll display"""
-        self.piano_roll_figure.clear()
+        ax = self.piano_roll_ax
 
-        ax = self.piano_roll_figure.add_subplot(111)
+        ax.set_title(
+            f'Piano Roll - {self.current_track.name if self.current_track else "No Track"}'
+        )
+
+        if self._grid_key != (self.project.length,
+                              self.project.time_signature[0]):
+            self.draw_piano_roll_grid()
+
+        # Draw notes for current track, one rectangle of vertices per note,
+        # culled to the visible time and pitch range
+        verts = np.empty((0, 4, 2))
+        if self.current_track:
+            track = self.current_track
+            view_x0, view_x1 = ax.get_xlim()
+            view_y0, view_y1 = ax.get_ylim()
+            visible = track.get_notes_in_range(view_x0, view_x1)
+            pitches = track.pitches[visible]
+            visible = visible[(pitches + 0.4 > view_y0)
+                              & (pitches - 0.4 < view_y1)]
+
+            x0 = track.start_times[visible]
+            x1 = x0 + track.durations[visible]
+            y0 = track.pitches[visible] - 0.4
+            y1 = y0 + 0.8
+            verts = np.stack([
+                np.stack([x0, x1, x1, x0], axis=1),
+                np.stack([y0, y0, y1, y1], axis=1)
+            ], axis=2)
+        self._note_collection.set_verts(verts)
+
+        # Full redraw; on_piano_roll_draw recaptures the cursor background
+        self._cursor_line.set_visible(self.is_playing)
+        self.piano_roll_canvas.draw_idle()
+
+    def draw_piano_roll_grid(self):
+        """Draw the static beat/key grid
+
+        The grid only depends on the project length and time signature, so
+        the line collections are cached and rebuilt only when those change.
+        """
+        ax = self.piano_roll_ax
 
-        # Set up the piano roll grid
         measures = self.project.length
         beats_per_measure = self.project.time_signature[0]
         total_beats = measures * beats_per_measure
-
-        # MIDI note range (show piano keys)
-        min_note = 36  # C2
-        max_note = 96  # C7
+        min_note = self.piano_roll_min_note
+        max_note = self.piano_roll_max_note
 
         ax.set_xlim(0, total_beats)
-        ax.set_ylim(min_note, max_note)
-
-        # Draw grid
-        # Vertical lines (beats)
-        for beat in range(int(total_beats) + 1):
-            color = 'black' if beat % beats_per_measure == 0 else 'gray'
-            alpha = 0.8 if beat % beats_per_measure == 0 else 0.3
-            ax.axvline(beat, color=color, alpha=alpha, linewidth=1)
-
-        # Horizontal lines (piano keys)
-        for note in range(min_note, max_note + 1):
-            note_name = self.note_names[note % 12]
-            color = 'black' if '#' in note_name else 'gray'
-            alpha = 0.3 if '#' in note_name else 0.1
-            ax.axhline(note, color=color, alpha=alpha, linewidth=0.5)
-
-        # Draw notes for current track
-        if self.current_track:
-            for note in self.current_track.notes:
-                # Draw note as rectangle
-                rect = plt.Rectangle((note.start_time, note.pitch - 0.4),
-                                     note.duration,
-                                     0.8,
-                                     facecolor='blue',
-                                     edgecolor='darkblue',
-                                     alpha=0.7)
-                ax.add_patch(rect)
-
-        # Draw playback position
-        if self.is_playing:
-            ax.axvline(self.playback_position,
-                       color='red',
-                       linewidth=2,
-                       alpha=0.8)
 
-        ax.set_xlabel('Time (beats)')
-        ax.set_ylabel('MIDI Note')
-        ax.set_title(
-            f'Piano Roll - {self.current_track.name if self.current_track else "No Track"}'
-        )
+        # Vertical lines (beats), bar lines emphasised
+        beats = np.arange(int(total_beats) + 1)
+        beat_segments = np.empty((len(beats), 2, 2))
+        beat_segments[:, :, 0] = beats[:, None]
+        beat_segments[:, 0, 1] = min_note
+        beat_segments[:, 1, 1] = max_note
+        is_bar = beats % beats_per_measure == 0
+
+        # Horizontal lines (piano keys), black keys emphasised
+        keys = np.arange(min_note, max_note + 1)
+        key_segments = np.empty((len(keys), 2, 2))
+        key_segments[:, 0, 0] = 0
+        key_segments[:, 1, 0] = total_beats
+        key_segments[:, :, 1] = keys[:, None]
+        is_sharp = self._sharp_mask[keys % 12]
+
+        for collection in self._grid_collections:
+            collection.remove()
+        self._grid_collections = [
+            LineCollection(beat_segments[is_bar],
+                           colors=[to_rgba('black', 0.8)],
+                           linewidths=1),
+            LineCollection(beat_segments[~is_bar],
+                           colors=[to_rgba('gray', 0.3)],
+                           linewidths=1),
+            LineCollection(key_segments[is_sharp],
+                           colors=[to_rgba('black', 0.3)],
+                           linewidths=0.5),
+            LineCollection(key_segments[~is_sharp],
+                           colors=[to_rgba('gray', 0.1)],
+                           linewidths=0.5),
+        ]
+        for collection in self._grid_collections:
+            ax.add_collection(collection)
+        self._grid_key = (measures, beats_per_measure)
 
-        # Add note names on y-axis
-        note_ticks = []
-        note_labels = []
-        for octave in range(2, 8):  # C2 to C7
-            for i, note_name in enumerate(self.note_names):
-                if note_name in ['C', 'E',
-                                 'G']:  # Show only some notes to avoid clutter
-                    note_num = octave * 12 + i
-                    if min_note <= note_num <= max_note:
-                        note_ticks.append(note_num)
-                        note_labels.append(f'{note_name}{octave}')
+        self.piano_roll_figure.tight_layout()
 
-        ax.set_yticks(note_ticks)
-        ax.set_yticklabels(note_labels)
+    def on_piano_roll_draw(self, event):
+        """Cache the rendered piano roll and draw the cursor over it"""
+        canvas = self.piano_roll_canvas
+        self.invalidate_piano_roll_transform()
+        self._cursor_background = canvas.copy_from_bbox(
+            self.piano_roll_ax.bbox)
+        if self._cursor_line.get_visible():
+            self.piano_roll_ax.draw_artist(self._cursor_line)
+
+    def update_playback_cursor(self):
+        """Move the playback cursor without rebuilding the piano roll"""
+        canvas = self.piano_roll_canvas
+        ax = self.piano_roll_ax
+        self._cursor_line.set_xdata([self.playback_position] * 2)
+        self._cursor_line.set_visible(self.is_playing)
+        if self._cursor_background is None:
+            canvas.draw_idle()
+            return
 
-        self.piano_roll_figure.tight_layout()
-        self.piano_roll_canvas.draw()
+        canvas.restore_region(self._cursor_background)
+        if self.is_playing:
+            ax.draw_artist(self._cursor_line)
+        canvas.blit(ax.bbox)
 
     def update_pattern_display(self):
         """Update the pattern visualization"""
-        self.pattern_figure.clear()
+        ax = self.pattern_ax
+        for artist in self._pattern_artists:
+            artist.remove()
+        self._pattern_artists = []
 
         # Create a chord progression visualization
-        ax = self.pattern_figure.add_subplot(111)
-
         chord_text = self.chord_text.GetValue()
         chords = [
             chord.strip() for chord in chord_text.split('-') if chord.strip()
@@ -604,29 +858,33 @@ class MusicMakerFrame(wx.Frame):
 
         if chords:
             x_positions = range(len(chords))
-            ax.bar(x_positions, [1] * len(chords),
-                   alpha=0.7,
-                   color='lightblue')
+            bars = ax.bar(x_positions, [1] * len(chords),
+                          alpha=0.7,
+                          color='lightblue')
+            self._pattern_artists.append(bars)
 
             for i, chord in enumerate(chords):
-                ax.text(i,
-                        0.5,
-                        chord,
-                        ha='center',
-                        va='center',
-                        fontsize=12,
-                        fontweight='bold')
+                self._pattern_artists.append(
+                    ax.text(i,
+                            0.5,
+                            chord,
+                            ha='center',
+                            va='center',
+                            fontsize=12,
+                            fontweight='bold'))
 
             ax.set_xlim(-0.5, len(chords) - 0.5)
-            ax.set_ylim(0, 1)
             ax.set_xlabel('Chord Position')
             ax.set_title('Chord Progression')
             ax.set_xticks(x_positions)
             ax.set_xticklabels([f'{i+1}' for i in x_positions])
-            ax.set_yticks([])
+        else:
+            ax.set_xlabel('')
+            ax.set_title('')
+            ax.set_xticks([])
 
         self.pattern_figure.tight_layout()
-        self.pattern_canvas.draw()
+        self.pattern_canvas.draw_idle()
 
     def note_name_to_midi(self, note_name):
         """Convert note name (e.g., 'C4') to MIDI number"""
@@ -639,13 +897,15 @@ class MusicMakerFrame(wx.Frame):
         except:
             octave = 4
 
-        if note in self.note_names:
-            note_num = self.note_names.index(note)
+        note_num = self._name_to_pc.get(note)
+        if note_num is not None:
             return octave * 12 + note_num
         return 60
 
     def midi_to_note_name(self, midi_num):
         """Convert MIDI number to note name"""
+        if 0 <= midi_num < len(self._midi_names):
+            return self._midi_names[midi_num]
         octave = midi_num // 12
         note = self.note_names[midi_num % 12]
         return f"{note}{octave}"
@@ -661,25 +921,38 @@ class MusicMakerFrame(wx.Frame):
         }
         return duration_map.get(self.duration_choice.GetStringSelection(), 1.0)
 
+    def piano_roll_to_data(self, pos):
+        """Convert a canvas pixel position to piano roll data coordinates
+
+        The inverted data transform is cached until the axes limits change
+        or the canvas is redrawn (e.g. after a resize).
+        """
+        inv = self._inv_transform
+        if inv is None:
+            inv = self._inv_transform = self.piano_roll_ax.transData.inverted()
+
+        # wx measures y down from the top, matplotlib up from the bottom
+        height = self.piano_roll_figure.bbox.height
+        return inv.transform((pos.x, height - pos.y))
+
+    def invalidate_piano_roll_transform(self, *args):
+        """Drop the cached display-to-data transform"""
+        self._inv_transform = None
+
     def on_piano_roll_click(self, event):
         """Handle clicks on piano roll"""
         if not self.current_track:
             return
 
         # Get click position - convert wxPython coordinates to matplotlib data coordinates
-        ax = self.piano_roll_figure.get_axes()[0]
-        
-        # Get mouse position in pixels from wxPython event
-        pos = event.GetPosition()
-        
-        # Convert display coordinates to data coordinates
         try:
-            # Transform from display coordinates to data coordinates
-            inv = ax.transData.inverted()
-            x, y = inv.transform(pos)
+            x, y = self.piano_roll_to_data(event.GetPosition())
         except:
             return
 
+        # Follow the pointer only while the button is held
+        self.track_piano_roll_motion(True)
+
         if x is None or y is None:
             return
 
@@ -701,17 +974,11 @@ class MusicMakerFrame(wx.Frame):
             velocity = self.velocity_ctrl.GetValue()
 
             # Check if note already exists at this position
-            existing_note = None
-            for note in self.current_track.notes:
-                if (abs(note.start_time - x) < 0.1 and note.pitch == y):
-                    existing_note = note
-                    break
-
-            if not existing_note:
+            if not self.current_track.has_note_at(y, x):
                 new_note = Note(y, duration, x, velocity)
                 self.current_track.add_note(new_note)
-                self.update_piano_roll()
-                self.status_bar.SetStatusText(
+                self.schedule_piano_roll_redraw()
+                self.set_status(
                     f"Added note: {self.midi_to_note_name(y)}")
                 
                 # Play audio feedback for the added note
@@ -720,42 +987,76 @@ class MusicMakerFrame(wx.Frame):
 
         elif self.eraser_tool.GetValue():
             # Remove note
-            notes_to_remove = []
-            for note in self.current_track.notes:
-                if (abs(note.start_time - x) < 0.5
-                        and abs(note.pitch - y) < 0.5):
-                    notes_to_remove.append(note)
-
-            for note in notes_to_remove:
-                self.current_track.remove_note(note)
+            notes_to_remove = self.current_track.find_notes_near(
+                x, y, 0.5, 0.5)
+
+            if len(notes_to_remove):
+                self.current_track.remove_notes(notes_to_remove)
+                self.schedule_piano_roll_redraw()
+                self.set_status("Removed note(s)")
+
+    def on_piano_roll_release(self, event):
+        """Stop following mouse motion when the button is released"""
+        self.track_piano_roll_motion(False)
+        event.Skip()
+
+    def track_piano_roll_motion(self, enable):
+        """Bind or unbind on_piano_roll_motion (no-op if already in that state)
+
+        Only this handler is unbound, leaving the canvas's own motion
+        bindings alone.
+        """
+        if enable == self._tracking_motion:
+            return
+        self._tracking_motion = enable
+        if enable:
+            self.piano_roll_canvas.Bind(wx.EVT_MOTION,
+                                        self.on_piano_roll_motion)
+        else:
+            self.piano_roll_canvas.Unbind(wx.EVT_MOTION,
+                                          handler=self.on_piano_roll_motion)
 
-            if notes_to_remove:
-                self.update_piano_roll()
-                self.status_bar.SetStatusText("Removed note(s)")
+    def on_hover_timer(self, event):
+        """Poll the pointer for the piano roll hover readout"""
+        canvas = self.piano_roll_canvas
+        if not canvas.IsShownOnScreen():
+            return
+        pos = canvas.ScreenToClient(wx.GetMousePosition())
+        if not canvas.GetClientRect().Contains(pos):
+            return
+        if pos != self._last_hover_pos:
+            self._last_hover_pos = pos
+            self.update_hover_status(pos)
 
     def on_piano_roll_motion(self, event):
-        """Handle mouse motion over piano roll"""
+        """Handle mouse motion over piano roll (bound while dragging)"""
+        if not event.LeftIsDown():
+            # The button was released outside the canvas, so no EVT_LEFT_UP
+            self.track_piano_roll_motion(False)
+            return
+        self.update_hover_status(event.GetPosition())
+
+    def update_hover_status(self, pos):
+        """Show the time and note under a canvas position"""
         # Convert wxPython coordinates to matplotlib data coordinates
-        ax = self.piano_roll_figure.get_axes()[0]
-        
-        # Get mouse position in pixels from wxPython event
-        pos = event.GetPosition()
-        
-        # Convert display coordinates to data coordinates
         try:
-            # Transform from display coordinates to data coordinates
-            inv = ax.transData.inverted()
-            x, y = inv.transform(pos)
-            
+            x, y = self.piano_roll_to_data(pos)
+
             # Check if coordinates are valid (within plot area)
             if x is not None and y is not None:
                 note_name = self.midi_to_note_name(int(round(y)))
                 time_pos = f"{x:.2f}"
-                self.status_bar.SetStatusText(
-                    f"Position: {time_pos} beats, Note: {note_name}")
+                status = f"Position: {time_pos} beats, Note: {note_name}"
+            else:
+                status = None
         except:
             # Clear status bar if coordinate conversion fails
-            self.status_bar.SetStatusText("")
+            status = ""
+
+        # Only touch the status bar when the readout actually changes
+        if status is not None and status != self._last_hover_status:
+            self._last_hover_status = status
+            self.set_status(status)
 
     def get_quantize_value(self):
         """Get quantize value"""
@@ -764,38 +1065,25 @@ class MusicMakerFrame(wx.Frame):
 
     def snap_to_scale(self, midi_note):
         """Snap MIDI note to current scale"""
+        return int(self.snap_pitches_to_scale(np.array([midi_note]))[0])
+
+    def snap_pitches_to_scale(self, midi_notes):
+        """Snap an array of MIDI notes to the current scale"""
         key_root = self.key_choice.GetSelection()
         scale_name = self.scale_choice.GetStringSelection()
 
-        if scale_name not in self.scales:
-            return midi_note
-
-        scale_notes = self.scales[scale_name]
-
-        # Find closest note in scale
-        note_in_octave = (midi_note - key_root) % 12
-
-        closest_distance = float('inf')
-        closest_note = note_in_octave
-
-        for scale_note in scale_notes:
-            distance = abs(note_in_octave - scale_note)
-            if distance < closest_distance:
-                closest_distance = distance
-                closest_note = scale_note
-
-        # Calculate the snapped MIDI note
-        octave_offset = (midi_note - key_root) // 12
-        snapped_note = key_root + octave_offset * 12 + closest_note
+        if scale_name not in self._scale_arrays:
+            return midi_notes
 
-        return snapped_note
+        return snap_batch(np.asarray(midi_notes, dtype=np.int64), key_root,
+                          self._scale_arrays[scale_name])
 
     def on_track_selected(self, event):
         """Handle track selection"""
         selection = self.tracks_list.GetSelection()
         if 0 <= selection < len(self.project.tracks):
             self.current_track = self.project.tracks[selection]
-            self.update_piano_roll()
+            self.schedule_piano_roll_redraw()
 
     def on_add_track(self, event):
         """Add new track"""
@@ -804,7 +1092,7 @@ class MusicMakerFrame(wx.Frame):
         self.project.add_track(track)
         self.current_track = track
         self.update_tracks_list()
-        self.update_piano_roll()
+        self.schedule_piano_roll_redraw()
 
     def on_remove_track(self, event):
         """Remove selected track"""
@@ -813,7 +1101,7 @@ class MusicMakerFrame(wx.Frame):
             self.current_track = self.project.tracks[
                 0] if self.project.tracks else None
             self.update_tracks_list()
-            self.update_piano_roll()
+            self.schedule_piano_roll_redraw()
 
     def on_play(self, event):
         """Start playback"""
@@ -822,24 +1110,44 @@ class MusicMakerFrame(wx.Frame):
             self.play_btn.SetLabel("⏸ Pause")
             self.playback_position = 0
 
-            # Start playback thread
-            self.playback_thread = threading.Thread(target=self.playback_loop,
-                                                    daemon=True)
+            # Start playback thread with its own edit queue
+            self._note_event_updates = queue.SimpleQueue()
+            self.playback_thread = threading.Thread(
+                target=self.playback_loop,
+                args=(self.note_events(), self._note_event_updates),
+                daemon=True)
             self.playback_thread.start()
+            self.position_timer.Start(POSITION_REFRESH_MS)
 
-            self.status_bar.SetStatusText("Playing...")
+            self.set_status("Playing...")
         else:
             self.is_playing = False
             self.play_btn.SetLabel("▶ Play")
-            self.status_bar.SetStatusText("Paused")
+            self.set_status("Paused")
+
+    def on_position_timer(self, event):
+        """Show the playback position written by the playback thread"""
+        position = self.playback_position
+        beats_per_measure = self.project.time_signature[0]
+        measures = int(position // beats_per_measure) + 1
+        beats = int(position % beats_per_measure) + 1
+        ticks = int((position % 1) * 480)  # 480 ticks per beat
+        label = f"{measures}:{beats}:{ticks}"
+        if label != self._last_position_label:
+            self._last_position_label = label
+            self.position_text.SetLabel(label)
+        self.update_playback_cursor()
+
+        if not self.is_playing:
+            self.position_timer.Stop()
 
     def on_stop(self, event):
         """Stop playback"""
         self.is_playing = False
         self.playback_position = 0
         self.play_btn.SetLabel("▶ Play")
-        self.update_piano_roll()
-        self.status_bar.SetStatusText("Stopped")
+        self.schedule_piano_roll_redraw()
+        self.set_status("Stopped")
 
     def on_record(self, event):
         """Toggle recording mode"""
@@ -851,93 +1159,204 @@ class MusicMakerFrame(wx.Frame):
         """Handle tempo change"""
         self.project.tempo = self.tempo_ctrl.GetValue()
 
-    def playback_loop(self):
-        """Playback loop thread"""
-        beats_per_minute = self.project.tempo
-        beats_per_second = beats_per_minute / 60.0
-        time_per_beat = 1.0 / beats_per_second
-
+    def note_events(self):
+        """Snapshot the current track as note-on event lists, sorted by time
+
+        Built on the GUI thread so the playback thread never reads the
+        track arrays while they are being edited.
+        """
+        track = self.current_track
+        if not track:
+            return [], [], []
+        # Track columns are already kept sorted by start time
+        return (track.start_times.tolist(), track.pitches.tolist(),
+                track.velocities.tolist())
+
+    def post_note_events(self):
+        """Hand the playback thread a fresh event list after edits"""
+        if self.is_playing:
+            self._note_event_updates.put(self.note_events())
+
+    def playback_loop(self, events, updates):
+        """Playback loop thread
+
+        The position is derived from the monotonic clock instead of being
+        accumulated from sleeps, so it does not drift. Note-ons are consumed
+        from the head of a pre-sorted event list and queued ahead of time
+        with absolute target times for the audio thread; edits made while
+        playing arrive as replacement event lists on the updates queue.
+        """
+        ns_per_beat = 60e9 / self.project.tempo
         max_beats = self.project.length * self.project.time_signature[0]
-
-        while self.is_playing and self.playback_position < max_beats:
-            # Update position display
-            measures = int(
-                self.playback_position // self.project.time_signature[0]) + 1
-            beats = int(
-                self.playback_position % self.project.time_signature[0]) + 1
-            ticks = int(
-                (self.playback_position % 1) * 480)  # 480 ticks per beat
-
-            wx.CallAfter(self.position_text.SetLabel,
-                         f"{measures}:{beats}:{ticks}")
-            # Removed frequent piano roll updates to prevent GUI hang
-
-            # Play notes (simplified - would need proper audio implementation)
-            if self.audio_enabled:
-                self.play_notes_at_position(self.playback_position)
-
-            # Advance position
-            self.playback_position += 0.1  # 0.1 beat increments
-
-            time.sleep(time_per_beat * 0.1)
+        lookahead_beats = SCHEDULE_LOOKAHEAD_NS / ns_per_beat
+
+        start_position = self.playback_position
+        t0 = time.monotonic_ns()
+        # Monotonic time at which beat 0 would have sounded
+        origin_ns = t0 - start_position * ns_per_beat
+        scheduled_until = start_position
+        next_tick_ns = t0
+
+        starts, pitches, velocities = events
+        cursor = bisect.bisect_left(starts, start_position)
+
+        while self.is_playing:
+            # Pick up the latest edit, resuming after what was already queued
+            while not updates.empty():
+                starts, pitches, velocities = updates.get()
+                cursor = bisect.bisect_left(starts, scheduled_until)
+
+            now = time.monotonic_ns()
+            position = start_position + (now - t0) / ns_per_beat
+            if position >= max_beats:
+                break
+            # Single writer; the GUI reads this from on_position_timer
+            self.playback_position = position
+
+            horizon = min(position + lookahead_beats, max_beats)
+            while cursor < len(starts) and starts[cursor] < horizon:
+                if self.audio_enabled:
+                    self.play_midi_note(
+                        pitches[cursor], velocities[cursor],
+                        int(origin_ns + starts[cursor] * ns_per_beat))
+                cursor += 1
+            scheduled_until = horizon
+
+            # Sleep to the next absolute tick deadline; if we're late, skip
+            # the missed ticks rather than bunching them up
+            next_tick_ns += PLAYBACK_TICK_NS
+            delay = next_tick_ns - time.monotonic_ns()
+            if delay > 0:
+                time.sleep(delay / 1e9)
+            else:
+                next_tick_ns = time.monotonic_ns()
 
         if self.is_playing:
             wx.CallAfter(self.on_stop, None)
 
-    def play_notes_at_position(self, position):
-        """Play notes at current position"""
-        if not self.audio_enabled or not self.current_track:
-            return
-            
-        # Find notes that should be playing at this position
-        active_notes = []
-        for note in self.current_track.notes:
-            note_start = note.start_time
-            note_end = note.start_time + note.duration
-            
-            # Check if note is active at current position
-            if note_start <= position < note_end:
-                active_notes.append(note)
-        
-        # Play active notes
-        for note in active_notes:
-            self.play_midi_note(note.pitch, note.velocity)
-    
-    def play_midi_note(self, midi_note, velocity=80):
-        """Generate and play audio for a MIDI note"""
+    def start_audio_worker(self):
+        """Start the thread that owns all pygame playback calls
+
+        GUI and playback code only enqueue note-on events; synthesis and
+        pygame calls happen on this thread so they never block the UI.
+        """
+        self._note_queue = collections.deque(maxlen=256)
+        self._note_event = threading.Event()
+        self._audio_running = True
+        self._audio_thread = threading.Thread(target=self.audio_worker,
+                                              daemon=True)
+        self._audio_thread.start()
+
+    def stop_audio_worker(self):
+        """Ask the audio thread to exit"""
+        self._audio_running = False
+        self._note_event.set()
+
+    def audio_worker(self):
+        """Audio thread: drain queued note-on events into pygame"""
+        for midi_note in PREWARM_PITCHES:
+            if not self._audio_running:
+                return
+            try:
+                self._note_sound(midi_note)
+            except Exception:
+                break
+
+        while self._audio_running:
+            self._note_event.wait()
+            self._note_event.clear()
+            while self._note_queue and self._audio_running:
+                midi_note, velocity, target_ns = self._note_queue.popleft()
+                self._wait_until(target_ns)
+                self._render_midi_note(midi_note, velocity)
+
+    @staticmethod
+    def _wait_until(target_ns):
+        """Sleep until close to target_ns, then spin for the remainder"""
+        remaining = target_ns - time.monotonic_ns()
+        if remaining > SPIN_WAIT_NS:
+            time.sleep((remaining - SPIN_WAIT_NS) / 1e9)
+        while time.monotonic_ns() < target_ns:
+            pass
+
+    def play_midi_note(self, midi_note, velocity=80, target_ns=None):
+        """Queue a MIDI note for playback on the audio thread
+
+        target_ns is an absolute time.monotonic_ns() value; None plays
+        the note as soon as possible.
+        """
         if not self.audio_enabled:
             return
-            
+
+        if target_ns is None:
+            target_ns = time.monotonic_ns()
+        # deque.append is atomic, so no lock is needed between threads
+        self._note_queue.append((midi_note, velocity, target_ns))
+        self._note_event.set()
+
+    def _note_sound(self, midi_note):
+        """Return the cached Sound for a pitch, synthesizing it on a miss"""
+        sound = self._note_cache.get(midi_note)
+        if sound is None:
+            sound = self._note_cache[midi_note] = self._synthesize_note(
+                midi_note)
+        return sound
+
+    def _render_midi_note(self, midi_note, velocity):
+        """Play a MIDI note from the sound cache (audio thread only)"""
         try:
-            # Convert MIDI note to frequency
-            frequency = 440.0 * (2.0 ** ((midi_note - 69) / 12.0))
-            
-            # Generate audio data
-            sample_rate = 22050
-            duration = 0.1  # Short note duration for playback
-            volume = min(velocity / 127.0 * 0.3, 0.3)  # Keep volume reasonable
-            
-            # Generate sine wave
-            samples = int(sample_rate * duration)
-            wave_array = np.zeros((samples, 2))
-            
-            for i in range(samples):
-                time_point = float(i) / sample_rate
-                wave_value = volume * np.sin(frequency * 2 * np.pi * time_point)
-                wave_array[i][0] = wave_value  # Left channel
-                wave_array[i][1] = wave_value  # Right channel
-            
-            # Convert to integers for pygame
-            wave_array = (wave_array * 32767).astype(np.int16)
-            
-            # Play the sound
-            sound = pygame.sndarray.make_sound(wave_array)
-            sound.play()
-            
+            # Velocity is applied per play on the channel, so one buffer
+            # per pitch serves every velocity (and overlapping notes)
+            channel = self._channels[self._channel_index]
+            self._channel_index = (self._channel_index + 1) % NOTE_CHANNELS
+            channel.set_volume(min(velocity / 127.0, 1.0))
+            channel.play(self._note_sound(midi_note))
+
         except Exception as e:
             # Fail silently to avoid disrupting playback
             pass
 
+    def _synthesize_note(self, midi_note):
+        """Render a short mono sine note at peak volume into a pygame Sound"""
+        # Convert MIDI note to frequency
+        frequency = 440.0 * (2.0 ** ((midi_note - 69) / 12.0))
+
+        # Generate audio data at whatever rate the mixer actually runs
+        sample_rate, _, channels = self._mixer_format
+        ramp, phase, idx, mono, wave_array = self._synthesis_buffers()
+
+        # Generate sine wave from the lookup table with a phase accumulator
+        phase_inc = frequency * SINE_TABLE_SIZE / sample_rate
+        np.multiply(ramp, np.float32(phase_inc), out=phase)
+        np.copyto(idx, phase, casting='unsafe')
+        np.bitwise_and(idx, SINE_TABLE_SIZE - 1, out=idx)
+        np.take(SINE_TABLE, idx, out=mono)
+        if channels > 1:
+            wave_array[...] = mono[:, None]
+
+        # make_sound copies the samples, so the buffers can be reused
+        return pygame.sndarray.make_sound(wave_array)
+
+    def _synthesis_buffers(self):
+        """Return the reusable sample buffers for _synthesize_note
+
+        Every preview note has the same length at the mixer's rate, so the
+        phase ramp and scratch buffers are allocated once (on the audio
+        thread, their only user).
+        """
+        if self._synth_buffers is None:
+            sample_rate, _, channels = self._mixer_format
+            samples = int(sample_rate * 0.1)  # Short note duration
+            ramp = np.arange(samples, dtype=np.float32)
+            phase = np.empty(samples, dtype=np.float32)
+            idx = np.empty(samples, dtype=np.int32)
+            mono = np.empty(samples, dtype=np.int16)
+            wave_array = mono
+            if channels > 1:
+                wave_array = np.empty((samples, channels), dtype=np.int16)
+            self._synth_buffers = (ramp, phase, idx, mono, wave_array)
+        return self._synth_buffers
+
     def on_generate_chords(self, event):
         """Generate chord progression"""
         chord_text = self.chord_text.GetValue()
@@ -949,52 +1368,52 @@ class MusicMakerFrame(wx.Frame):
             return
 
         # Clear existing notes
-        self.current_track.notes.clear()
+        self.current_track.clear()
 
-        # Generate chord notes
+        # Generate chord notes as arrays in one kernel call
         chord_duration = 4.0  # 4 beats per chord
+        roots, qualities = self.parse_chords(chords)
+        pitches, start_times = build_chord_arrays(roots, qualities,
+                                                  self._chord_intervals,
+                                                  self._chord_interval_counts,
+                                                  chord_duration)
 
-        for i, chord_name in enumerate(chords):
-            start_time = i * chord_duration
-
-            # Simple chord generation (would be more sophisticated in real implementation)
-            root_note = self.chord_name_to_root(chord_name)
-
-            if 'm' in chord_name.lower():
-                # Minor chord
-                chord_notes = [root_note, root_note + 3, root_note + 7]
-            else:
-                # Major chord
-                chord_notes = [root_note, root_note + 4, root_note + 7]
-
-            for note_pitch in chord_notes:
-                note = Note(note_pitch, chord_duration, start_time, 70)
-                self.current_track.add_note(note)
-
-        self.update_piano_roll()
-        self.status_bar.SetStatusText("Generated chord progression")
+        # Snap the whole progression in one batched call
+        if self.snap_to_scale_cb.GetValue():
+            pitches = self.snap_pitches_to_scale(pitches)
+
+        self.current_track.add_notes(pitches, chord_duration, start_times, 70)
+
+        self.schedule_piano_roll_redraw()
+        self.set_status("Generated chord progression")
+
+    def parse_chords(self, chords):
+        """Parse chord names into root MIDI numbers and quality indices
+
+        Unparseable names become a C major triad.
+        """
+        parsed = [CHORD_RE.match(chord_name) for chord_name in chords]
+        roots = np.fromiter(
+            (CHORD_ROOTS[m.group(1)] if m else 60 for m in parsed),
+            dtype=np.int64, count=len(parsed))
+        qualities = np.fromiter(
+            (self.chord_quality(m.group(2)) if m else 0 for m in parsed),
+            dtype=np.int64, count=len(parsed))
+        return roots, qualities
+
+    def chord_quality(self, suffix):
+        """Return the chord interval table row for a quality suffix"""
+        quality = self._chord_quality_index.get(suffix)
+        if quality is None:
+            # Unknown extension: fall back to the plain triad
+            minor = suffix.startswith('m') and not suffix.startswith('maj')
+            quality = self._chord_quality_index['m' if minor else '']
+        return quality
 
     def chord_name_to_root(self, chord_name):
         """Convert chord name to root note MIDI number"""
-        # Simple mapping (would be more sophisticated in real implementation)
-        note_map = {
-            'C': 60,
-            'D': 62,
-            'E': 64,
-            'F': 65,
-            'G': 67,
-            'A': 69,
-            'B': 71,
-            'Cm': 60,
-            'Dm': 62,
-            'Em': 64,
-            'Fm': 65,
-            'Gm': 67,
-            'Am': 69,
-            'Bm': 71
-        }
-
-        return note_map.get(chord_name, 60)
+        roots, _ = self.parse_chords([chord_name])
+        return int(roots[0])
 
     def on_apply_rhythm(self, event):
         """Apply rhythm pattern"""
@@ -1014,21 +1433,25 @@ class MusicMakerFrame(wx.Frame):
             return
 
         # Apply pattern to existing notes or create new ones
-        if not self.current_track.notes:
+        if not len(self.current_track):
             # Create new notes
             base_pitch = 60  # C4
-            for beat in pattern:
-                note = Note(base_pitch, 0.5, beat, 80)
-                self.current_track.add_note(note)
+            if self.snap_to_scale_cb.GetValue():
+                base_pitch = self.snap_to_scale(base_pitch)
+            self.current_track.add_notes(np.full(len(pattern), base_pitch),
+                                         0.5, pattern, 80)
         else:
-            # Quantize existing notes to pattern
-            for note in self.current_track.notes:
-                closest_beat = min(pattern,
-                                   key=lambda x: abs(x - note.start_time))
-                note.start_time = closest_beat
-
-        self.update_piano_roll()
-        self.status_bar.SetStatusText(f"Applied {rhythm_name} rhythm")
+            # Quantize existing notes to the nearest pattern position
+            pat = np.asarray(sorted(pattern), dtype=np.float64)
+            starts = self.current_track.start_times
+            idx = np.clip(np.searchsorted(pat, starts), 1, len(pat) - 1)
+            left = pat[idx - 1]
+            right = pat[idx]
+            self.current_track.set_start_times(
+                np.where(starts - left <= right - starts, left, right))
+
+        self.schedule_piano_roll_redraw()
+        self.set_status(f"Applied {rhythm_name} rhythm")
 
     def on_new_pattern(self, event):
         """Create new pattern"""
@@ -1072,8 +1495,8 @@ class MusicMakerFrame(wx.Frame):
     def load_project(self, filepath):
         """Load project from file"""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = loads_project(f.read())
 
             # Load project data
             self.project = MusicProject()
@@ -1090,12 +1513,12 @@ class MusicMakerFrame(wx.Frame):
                               track_data.get('instrument', 0))
                 track.volume = track_data.get('volume', 80)
 
-                # Load notes
-                for note_data in track_data.get('notes', []):
-                    note = Note(note_data['pitch'], note_data['duration'],
-                                note_data['start_time'],
-                                note_data.get('velocity', 80))
-                    track.add_note(note)
+                # Load notes as columns in one bulk insert
+                notes = track_data.get('notes', [])
+                track.add_notes([n['pitch'] for n in notes],
+                                [n['duration'] for n in notes],
+                                [n['start_time'] for n in notes],
+                                [n.get('velocity', 80) for n in notes])
 
                 self.project.add_track(track)
 
@@ -1106,9 +1529,9 @@ class MusicMakerFrame(wx.Frame):
 
             self.tempo_ctrl.SetValue(self.project.tempo)
             self.update_tracks_list()
-            self.update_piano_roll()
+            self.schedule_piano_roll_redraw()
 
-            self.status_bar.SetStatusText(
+            self.set_status(
                 f"Loaded: {os.path.basename(filepath)}")
 
         except Exception as e:
@@ -1118,38 +1541,10 @@ class MusicMakerFrame(wx.Frame):
     def save_project(self, filepath):
         """Save project to file"""
         try:
-            data = {
-                'name': self.project.project_name,
-                'tempo': self.project.tempo,
-                'time_signature': list(self.project.time_signature),
-                'key': self.project.key,
-                'length': self.project.length,
-                'tracks': []
-            }
-
-            for track in self.project.tracks:
-                track_data = {
-                    'name': track.name,
-                    'instrument': track.instrument,
-                    'volume': track.volume,
-                    'notes': []
-                }
-
-                for note in track.notes:
-                    note_data = {
-                        'pitch': note.pitch,
-                        'duration': note.duration,
-                        'start_time': note.start_time,
-                        'velocity': note.velocity
-                    }
-                    track_data['notes'].append(note_data)
-
-                data['tracks'].append(track_data)
-
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
-
-            self.status_bar.SetStatusText(
+            with open(filepath, 'w', encoding='utf-8') as f:
+                write_project(f, self.project)
+
+            self.set_status(
                 f"Saved: {os.path.basename(filepath)}")
 
         except Exception as e:
@@ -1160,6 +1555,10 @@ class MusicMakerFrame(wx.Frame):
         """Exit application"""
         if self.is_playing:
             self.on_stop(event)
+        self.hover_timer.Stop()
+        self.position_timer.Stop()
+        if self.audio_enabled:
+            self.stop_audio_worker()
         self.Close()
 
 
@@ -1,21 +1,71 @@
 import wx
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_wxagg import FigureCanvasWxAgg as FigureCanvas
-from matplotlib.figure import Figure
 import threading
 import time
 import os
-import glob
 
 # Note: For full functionality, you would need pygame for audio playback
 # and librosa for audio analysis. This is a demo version with simulated data.
 
-try:
-    import pygame
-    PYGAME_AVAILABLE = True
-except ImportError:
-    PYGAME_AVAILABLE = False
+# pygame and matplotlib are imported on first use (see _import_pygame and
+# MusicVisualizerFrame.init_ui) so that importing this module stays cheap.
+pygame = None
+PYGAME_AVAILABLE = False
+
+
+def _import_pygame():
+    """Import pygame once and return whether it is available"""
+    global pygame, PYGAME_AVAILABLE
+    if pygame is None:
+        try:
+            import pygame as pygame_module
+        except ImportError:
+            return False
+        pygame = pygame_module
+        PYGAME_AVAILABLE = True
+    return PYGAME_AVAILABLE
+
+
+# Fused single-pass versions of the demo data math. They are compiled with
+# Numba by _compile_kernels() on first use (cached on disk afterwards) and
+# only called when that succeeds; otherwise the NumPy path is used.
+NUMBA_AVAILABLE = False
+_kernels_checked = False
+
+
+def _spectrum_kernel(decay, peak_sum, noise, noise2, out):
+    for i in range(out.shape[0]):
+        out[i] = decay[i] * noise[i] * 0.8 + peak_sum[i] + 0.1 * noise2[i]
+
+
+def _waveform_kernel(base_wave, noise, out):
+    for i in range(out.shape[0]):
+        out[i] = base_wave[i] + 0.1 * noise[i]
+
+
+def _compile_kernels():
+    """Import numba and compile the kernels once; return whether it worked"""
+    global NUMBA_AVAILABLE, _kernels_checked
+    global _spectrum_kernel, _waveform_kernel
+    if not _kernels_checked:
+        _kernels_checked = True
+        try:
+            from numba import njit
+        except ImportError:
+            return False
+        options = dict(cache=True, fastmath=True, boundscheck=False)
+        _spectrum_kernel = njit(
+            'void(float32[:], float32[:], float32[:], float32[:], float32[:])',
+            **options)(_spectrum_kernel)
+        _waveform_kernel = njit('void(float32[:], float32[:], float32[:])',
+                                **options)(_waveform_kernel)
+        NUMBA_AVAILABLE = True
+    return NUMBA_AVAILABLE
+
+
+# Visualization timer period, and the slower one used while minimized
+UPDATE_INTERVAL_MS = 50
+ICONIZED_UPDATE_INTERVAL_MS = 500
 
 
 class AudioVisualizer:
@@ -27,12 +77,45 @@ class AudioVisualizer:
         self.position = 0
         self.duration = 100
 
-        if PYGAME_AVAILABLE:
+        if _import_pygame():
             pygame.mixer.init(frequency=22050,
                               size=-16,
                               channels=2,
                               buffer=1024)
 
+        _compile_kernels()
+
+        # Demo data buffers are allocated once and refilled in place on
+        # every frame; only the noise changes between calls. Constants are
+        # evaluated in float64 and stored as float32, which is plenty for
+        # display and halves the memory traffic per frame.
+        self._rng = np.random.default_rng()
+        # Only the lower half of the 512-bin 0-22050 Hz grid is displayed,
+        # so just those 256 bins are generated
+        freqs = np.linspace(0, 22050, 512)[:256]
+        self._freqs = freqs.astype(np.float32)
+        self._decay = np.exp(-freqs / 5000).astype(np.float32)
+        # Peaks for bass, mids, and highs depend only on the fixed grid
+        self._peak_sum = (np.exp(-((freqs - 80) / 50)**2) * 0.6 +
+                          np.exp(-((freqs - 1000) / 200)**2) * 0.4 +
+                          np.exp(-((freqs - 8000) / 1000)**2) * 0.3
+                          ).astype(np.float32)
+        self._noise = np.empty((2, 256), dtype=np.float32)
+        self._spectrum = np.empty(256, dtype=np.float32)
+        self._idle_spectrum = np.zeros(256, dtype=np.float32)
+
+        t = np.linspace(0, 1, 1024)
+        self._t = t.astype(np.float32)
+        # Complex waveform with multiple harmonics, with the -0.05 noise
+        # offset folded in
+        self._base_wave = (np.sin(2 * np.pi * 440 * t) * 0.5 +
+                           np.sin(2 * np.pi * 880 * t) * 0.3 +
+                           np.sin(2 * np.pi * 1320 * t) * 0.2 - 0.05
+                           ).astype(np.float32)
+        self._wave = np.empty(1024, dtype=np.float32)
+        self._wave_noise = np.empty(1024, dtype=np.float32)
+        self._idle_wave = np.zeros(1024, dtype=np.float32)
+
     def load_file(self, filepath):
         self.current_file = filepath
         if PYGAME_AVAILABLE:
@@ -69,36 +152,39 @@ class AudioVisualizer:
     def get_spectrum_data(self):
         """Generate demo spectrum data - in real implementation, use FFT on audio stream"""
         if self.is_playing:
-            # Generate realistic-looking spectrum data
-            freqs = np.linspace(0, 22050, 512)
-
-            # Simulate different frequency responses for different types of music
-            base_response = np.exp(-freqs / 5000) * np.random.random(512) * 0.8
+            self._rng.random(dtype=np.float32, out=self._noise)
+            noise, noise2 = self._noise
+            spectrum = self._spectrum
+            if NUMBA_AVAILABLE:
+                _spectrum_kernel(self._decay, self._peak_sum, noise, noise2,
+                                 spectrum)
+            else:
+                # Simulate different frequency responses for different types of music
+                np.multiply(self._decay, noise, out=spectrum)
+                spectrum *= 0.8
 
-            # Add some peaks for bass, mids, and highs
-            bass_peak = np.exp(-((freqs - 80) / 50)**2) * 0.6
-            mid_peak = np.exp(-((freqs - 1000) / 200)**2) * 0.4
-            high_peak = np.exp(-((freqs - 8000) / 1000)**2) * 0.3
+                spectrum += self._peak_sum
 
-            spectrum = base_response + bass_peak + mid_peak + high_peak
-            spectrum += np.random.random(512) * 0.1  # Add some noise
+                noise2 *= 0.1  # Add some noise
+                spectrum += noise2
 
-            return freqs[:256], spectrum[:256]  # Return half for display
+            return self._freqs, spectrum
         else:
-            return np.linspace(0, 22050, 256), np.zeros(256)
+            return self._freqs, self._idle_spectrum
 
     def get_waveform_data(self):
         """Generate demo waveform data"""
         if self.is_playing:
-            t = np.linspace(0, 1, 1024)
-            # Create a complex waveform with multiple harmonics
-            wave = (np.sin(2 * np.pi * 440 * t) * 0.5 +
-                    np.sin(2 * np.pi * 880 * t) * 0.3 +
-                    np.sin(2 * np.pi * 1320 * t) * 0.2)
-            wave += np.random.random(1024) * 0.1 - 0.05
-            return t, wave
+            if NUMBA_AVAILABLE:
+                self._rng.random(dtype=np.float32, out=self._wave_noise)
+                _waveform_kernel(self._base_wave, self._wave_noise, self._wave)
+            else:
+                self._rng.random(dtype=np.float32, out=self._wave)
+                self._wave *= 0.1
+                self._wave += self._base_wave
+            return self._t, self._wave
         else:
-            return np.linspace(0, 1, 1024), np.zeros(1024)
+            return self._t, self._idle_wave
 
 
 class MusicVisualizerFrame(wx.Frame):
@@ -108,7 +194,11 @@ class MusicVisualizerFrame(wx.Frame):
 
         self.audio_visualizer = AudioVisualizer()
         self.update_timer = None
+        self._iconized = False
+        self._volume_pending = False
+        self._last_tick = 0.0
         self.playlist = []
+        self._playlist_paths = set()
         self.current_track_index = 0
 
         # Center the window on screen
@@ -278,9 +368,14 @@ class MusicVisualizerFrame(wx.Frame):
         viz_sizer.Add(viz_controls_sizer, 0, wx.ALL | wx.CENTER, 5)
 
         # Visualization canvas
+        from matplotlib.backends.backend_wxagg import (
+            FigureCanvasWxAgg as FigureCanvas)
+        from matplotlib.figure import Figure
+
         self.figure = Figure(figsize=(8, 6), facecolor='black')
         self.canvas = FigureCanvas(viz_panel, -1, self.figure)
         viz_sizer.Add(self.canvas, 1, wx.ALL | wx.EXPAND, 5)
+        self.setup_visualization_axes()
 
         viz_panel.SetSizer(viz_sizer)
         content_sizer.Add(viz_panel, 1, wx.ALL | wx.EXPAND, 5)
@@ -296,7 +391,7 @@ class MusicVisualizerFrame(wx.Frame):
         # Initialize visualization
         self.viz_colors = ['cyan', 'magenta', 'yellow', 'lime']
         self.current_color_index = 0
-        self.update_visualization()
+        self.show_visualization()
 
     def create_menu_bar(self):
         menu_bar = wx.MenuBar()
@@ -336,18 +431,64 @@ class MusicVisualizerFrame(wx.Frame):
         self.Bind(wx.EVT_MENU, self.on_exit, id=wx.ID_EXIT)
 
     def start_visualization_timer(self):
-        self.update_timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self.on_timer_update)
-        self.update_timer.Start(50)  # Update every 50ms
+        """Start the update tick chain
+
+        Each tick reschedules the next one only after it has finished, so
+        a slow draw delays the following tick instead of letting timer
+        events pile up behind it. That spacing is also what limits the
+        draw rate, so no separate frame throttle is needed.
+        """
+        self.Bind(wx.EVT_ICONIZE, self.on_iconize)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self._last_tick = time.perf_counter()
+        self.update_timer = wx.CallLater(UPDATE_INTERVAL_MS,
+                                         self.on_timer_update)
+
+    def on_iconize(self, event):
+        """Tick slowly while minimized; nothing is drawn until restored"""
+        self._iconized = event.IsIconized()
+        if self.update_timer:
+            self.update_timer.Start(ICONIZED_UPDATE_INTERVAL_MS
+                                    if self._iconized else UPDATE_INTERVAL_MS)
+        event.Skip()
+
+    def on_close(self, event):
+        """End the tick chain before the frame is destroyed"""
+        self.stop_visualization_timer()
+        event.Skip()
+
+    def stop_visualization_timer(self):
+        if self.update_timer:
+            self.update_timer.Stop()
+            self.update_timer = None
+
+    def on_timer_update(self):
+        try:
+            self.update_tick()
+        finally:
+            # Closing the frame (possibly from within this tick, via
+            # on_stop) ends the chain
+            if self.update_timer and not self.IsBeingDeleted():
+                self.update_timer.Start(ICONIZED_UPDATE_INTERVAL_MS
+                                        if self._iconized else
+                                        UPDATE_INTERVAL_MS)
+
+    def update_tick(self):
+        now = time.perf_counter()
+        elapsed = now - self._last_tick
+        self._last_tick = now
 
-    def on_timer_update(self, event):
         if self.audio_visualizer.is_playing:
             # Update progress
-            self.audio_visualizer.position += 0.05  # Simulated progress
+            self.audio_visualizer.position += elapsed  # Simulated progress
             if self.audio_visualizer.position >= self.audio_visualizer.duration:
                 self.audio_visualizer.position = self.audio_visualizer.duration
                 self.on_stop(None)
 
+            # Nobody can see the window, so skip the redraw
+            if self._iconized or not self.IsShown():
+                return
+
             # Update UI
             self.update_progress_display()
             self.update_visualization()
@@ -392,27 +533,35 @@ class MusicVisualizerFrame(wx.Frame):
                 f"Loaded: {os.path.basename(filepath)}")
 
             # Add to playlist if not already there
-            if filepath not in [item[0] for item in self.playlist]:
-                self.add_to_playlist(filepath)
+            self.add_to_playlist(filepath)
         else:
             wx.MessageBox("Failed to load audio file.", "Error",
                           wx.OK | wx.ICON_ERROR)
 
     def load_folder(self, folder_path):
-        audio_extensions = ['*.mp3', '*.wav', '*.ogg', '*.flac', '*.m4a']
-        audio_files = []
+        audio_extensions = {'.mp3', '.wav', '.ogg', '.flac', '.m4a'}
 
-        for ext in audio_extensions:
-            audio_files.extend(glob.glob(os.path.join(folder_path, ext)))
-            audio_files.extend(
-                glob.glob(os.path.join(folder_path, ext.upper())))
+        # One directory scan, matching extensions case-insensitively
+        # (hidden files are skipped, as glob did)
+        with os.scandir(folder_path) as entries:
+            audio_files = [
+                entry.path for entry in entries
+                if not entry.name.startswith('.') and entry.is_file() and
+                os.path.splitext(entry.name)[1].lower() in audio_extensions
+            ]
 
         if audio_files:
             self.playlist.clear()
-            self.playlist_ctrl.DeleteAllItems()
+            self._playlist_paths.clear()
 
-            for filepath in sorted(audio_files):
-                self.add_to_playlist(filepath)
+            # Hold off list repaints until every row has been inserted
+            self.playlist_ctrl.Freeze()
+            try:
+                self.playlist_ctrl.DeleteAllItems()
+                for filepath in sorted(audio_files):
+                    self.add_to_playlist(filepath)
+            finally:
+                self.playlist_ctrl.Thaw()
 
             # Load first file
             if self.playlist:
@@ -425,10 +574,14 @@ class MusicVisualizerFrame(wx.Frame):
                           "No Files", wx.OK | wx.ICON_WARNING)
 
     def add_to_playlist(self, filepath):
+        if filepath in self._playlist_paths:
+            return
+
         filename = os.path.basename(filepath)
         duration = "03:30"  # Demo duration
 
-        self.playlist.append((filepath, duration))
+        self._playlist_paths.add(filepath)
+        self.playlist.append((filepath, filename, duration))
 
         index = self.playlist_ctrl.InsertItem(len(self.playlist) - 1, filename)
         self.playlist_ctrl.SetItem(index, 1, duration)
@@ -442,6 +595,7 @@ class MusicVisualizerFrame(wx.Frame):
 
     def on_clear_playlist(self, event):
         self.playlist.clear()
+        self._playlist_paths.clear()
         self.playlist_ctrl.DeleteAllItems()
         self.current_track_index = 0
 
@@ -451,11 +605,14 @@ class MusicVisualizerFrame(wx.Frame):
         self.update_playlist_display()
 
     def update_playlist_display(self):
-        self.playlist_ctrl.DeleteAllItems()
-        for i, (filepath, duration) in enumerate(self.playlist):
-            filename = os.path.basename(filepath)
-            index = self.playlist_ctrl.InsertItem(i, filename)
-            self.playlist_ctrl.SetItem(index, 1, duration)
+        self.playlist_ctrl.Freeze()
+        try:
+            self.playlist_ctrl.DeleteAllItems()
+            for i, (filepath, filename, duration) in enumerate(self.playlist):
+                index = self.playlist_ctrl.InsertItem(i, filename)
+                self.playlist_ctrl.SetItem(index, 1, duration)
+        finally:
+            self.playlist_ctrl.Thaw()
 
     def on_play(self, event):
         self.audio_visualizer.play()
@@ -475,9 +632,20 @@ class MusicVisualizerFrame(wx.Frame):
         self.status_bar.SetStatusText("Stopped")
 
     def on_volume_change(self, event):
+        """Update the label now; coalesce mixer volume changes during a drag
+
+        Slider events within ~30 ms of each other result in a single
+        set_volume call with the slider's latest value.
+        """
         volume = self.volume_slider.GetValue()
-        self.audio_visualizer.set_volume(volume)
         self.volume_label.SetLabel(f"{volume}%")
+        if not self._volume_pending:
+            self._volume_pending = True
+            wx.CallLater(30, self._apply_volume)
+
+    def _apply_volume(self):
+        self._volume_pending = False
+        self.audio_visualizer.set_volume(self.volume_slider.GetValue())
 
     def on_seek(self, event):
         if self.audio_visualizer.duration > 0:
@@ -486,186 +654,294 @@ class MusicVisualizerFrame(wx.Frame):
             self.audio_visualizer.position = position
 
     def on_viz_changed(self, event):
-        self.update_visualization()
+        self.show_visualization()
 
     def on_change_colors(self, event):
         self.current_color_index = (self.current_color_index + 1) % len(
             self.viz_colors)
-        self.update_visualization()
+        self.show_visualization()
+
+    def setup_visualization_axes(self):
+        """Create one persistent Axes, with its artists, per visualization
+
+        Only the selected Axes is visible. Per-frame updates change artist
+        data and blit them over a cached background instead of clearing and
+        rebuilding the figure.
+        """
+        from matplotlib.collections import PolyCollection
+        from matplotlib.ticker import FixedLocator, NullLocator
+        from matplotlib.patches import Circle
+
+        self._viz_axes = []
+        for label in ('spectrum', 'waveform', 'bars', 'circle'):
+            ax = self.figure.add_subplot(111, facecolor='black', label=label)
+            ax.set_visible(False)
+            self._viz_axes.append(ax)
+        spectrum_ax, waveform_ax, bars_ax, circle_ax = self._viz_axes
+
+        # Spectrum: filled area under a line
+        spectrum_ax.set_xlim(0, 10000)
+        spectrum_ax.set_ylim(0, 1)
+        spectrum_ax.xaxis.set_major_locator(
+            FixedLocator(np.arange(0, 10001, 2000)))
+        spectrum_ax.yaxis.set_major_locator(FixedLocator(np.linspace(0, 1, 6)))
+        self._style_viz_axes(spectrum_ax, 'Frequency (Hz)', 'Amplitude',
+                             'Frequency Spectrum')
+        self._spectrum_fill = spectrum_ax.fill_between([0, 1], [0, 0],
+                                                       alpha=0.7,
+                                                       animated=True)
+        self._spectrum_line, = spectrum_ax.plot([], [],
+                                                linewidth=2,
+                                                animated=True)
+
+        # Waveform: line over a faint fill
+        waveform_ax.set_xlim(0, 1)
+        waveform_ax.set_ylim(-1, 1)
+        waveform_ax.xaxis.set_major_locator(FixedLocator(np.linspace(0, 1, 6)))
+        waveform_ax.yaxis.set_major_locator(FixedLocator(np.linspace(-1, 1, 9)))
+        self._style_viz_axes(waveform_ax, 'Time', 'Amplitude', 'Waveform')
+        self._waveform_line, = waveform_ax.plot([], [],
+                                                linewidth=1,
+                                                animated=True)
+        self._waveform_fill = waveform_ax.fill_between([0, 1], [0, 0],
+                                                       alpha=0.3,
+                                                       animated=True)
+
+        # Bars: one bar per band plus a glow over the top half. Each layer
+        # is a single collection of rectangles (corners bottom-left,
+        # bottom-right, top-right, top-left) whose y values are rewritten
+        # in place every frame.
+        num_bars = 32
+        bars_ax.set_xlim(-0.5, num_bars - 0.5)
+        bars_ax.set_ylim(0, 1)
+        bars_ax.xaxis.set_major_locator(FixedLocator(np.arange(0, num_bars, 5)))
+        bars_ax.yaxis.set_major_locator(FixedLocator(np.linspace(0, 1, 6)))
+        self._style_viz_axes(bars_ax, 'Frequency Bands', 'Amplitude',
+                             'Frequency Bars')
+        centers = np.arange(num_bars)
+        self._bar_verts = np.zeros((num_bars, 4, 2))
+        self._bar_verts[:, (0, 3), 0] = (centers - 0.4)[:, None]
+        self._bar_verts[:, (1, 2), 0] = (centers + 0.4)[:, None]
+        self._bar_glow_verts = self._bar_verts.copy()
+        self._bars = PolyCollection(self._bar_verts, alpha=0.8, animated=True)
+        self._bar_glow = PolyCollection(self._bar_glow_verts, alpha=0.3,
+                                        animated=True)
+        bars_ax.add_collection(self._bars, autolim=False)
+        bars_ax.add_collection(self._bar_glow, autolim=False)
+
+        # Circle: filled polar outline around a static inner disc
+        circle_ax.set_xlim(-1, 1)
+        circle_ax.set_ylim(-1, 1)
+        circle_ax.xaxis.set_major_locator(NullLocator())
+        circle_ax.yaxis.set_major_locator(NullLocator())
+        circle_ax.set_aspect('equal')
+        circle_ax.set_title('Circular Spectrum', color='white')
+        circle_ax.axis('off')
+        self._circle_fill, = circle_ax.fill([0], [0], alpha=0.7, animated=True)
+        self._circle_line, = circle_ax.plot([], [],
+                                            linewidth=2,
+                                            animated=True)
+        self._circle_center = Circle((0, 0), 0.3, alpha=0.3, animated=True)
+        circle_ax.add_patch(self._circle_center)
+
+        # The outline samples a fixed set of spectrum bins at fixed angles
+        num_points = 64
+        angles = np.linspace(0, 2 * np.pi, num_points)
+        self._circle_cos = np.cos(angles).astype(np.float32)
+        self._circle_sin = np.sin(angles).astype(np.float32)
+        num_bins = len(self.audio_visualizer.get_spectrum_data()[1])
+        self._circle_indices = np.linspace(0, num_bins - 1,
+                                           num_points).astype(int)
+        # Closed outline, with the first point repeated at the end
+        self._circle_xy = np.empty((num_points + 1, 2), dtype=np.float32)
+
+        # Limits and ticks are fixed above, so full redraws (on resize or
+        # when switching visualization) skip autoscaling and tick location
+        for ax in self._viz_axes:
+            ax.set_autoscale_on(False)
+
+        self._viz_artists = (
+            (self._spectrum_fill, self._spectrum_line),
+            (self._waveform_line, self._waveform_fill),
+            (self._bars, self._bar_glow),
+            (self._circle_fill, self._circle_line, self._circle_center),
+        )
+
+        # Indexed by the viz_choice selection, which show_visualization caches
+        self._viz_funcs = (self.draw_spectrum, self.draw_waveform,
+                           self.draw_bars, self.draw_circle)
+        self._viz_index = 0
+
+        self._viz_background = None
+        self.canvas.mpl_connect('draw_event', self.on_canvas_draw)
+
+    def _style_viz_axes(self, ax, xlabel, ylabel, title):
+        ax.set_xlabel(xlabel, color='white')
+        ax.set_ylabel(ylabel, color='white')
+        ax.set_title(title, color='white')
+        ax.tick_params(colors='white')
 
-    def update_visualization(self):
-        self.figure.clear()
+        for spine in ax.spines.values():
+            spine.set_color('white')
+
+    def show_visualization(self):
+        """Switch to the selected visualization and color
 
-        viz_type = self.viz_choice.GetSelection()
+        Drops the blit background so the next update does a full redraw,
+        which recaptures it (see on_canvas_draw).
+        """
+        viz_type = self._viz_index = self.viz_choice.GetSelection()
         color = self.viz_colors[self.current_color_index]
 
-        if viz_type == 0:  # Spectrum
-            self.draw_spectrum(color)
-        elif viz_type == 1:  # Waveform
-            self.draw_waveform(color)
-        elif viz_type == 2:  # Bars
-            self.draw_bars(color)
-        elif viz_type == 3:  # Circle
-            self.draw_circle(color)
+        for i, ax in enumerate(self._viz_axes):
+            ax.set_visible(i == viz_type)
+        for artists in self._viz_artists:
+            for artist in artists:
+                artist.set_color(color)
 
-        self.canvas.draw()
+        self._viz_background = None
+        self.update_visualization()
 
-    def draw_spectrum(self, color):
-        ax = self.figure.add_subplot(111, facecolor='black')
+    def on_canvas_draw(self, event):
+        """Cache the static parts of the figure and draw the data over them"""
+        self._viz_background = self.canvas.copy_from_bbox(self.figure.bbox)
+        viz_type = self._viz_index
+        ax = self._viz_axes[viz_type]
+        for artist in self._viz_artists[viz_type]:
+            ax.draw_artist(artist)
 
+    def update_visualization(self):
+        viz_type = self._viz_index
+        self._viz_funcs[viz_type]()
+
+        if self._viz_background is None:
+            # No full draw yet (or it was invalidated); the draw_event
+            # handler will capture the background and paint the artists
+            self.canvas.draw_idle()
+            return
+
+        ax = self._viz_axes[viz_type]
+        self.canvas.restore_region(self._viz_background)
+        for artist in self._viz_artists[viz_type]:
+            ax.draw_artist(artist)
+        self.canvas.blit(ax.bbox)
+
+    @staticmethod
+    def _set_fill(collection, x, y):
+        """Reshape a fill_between PolyCollection to the area under y"""
+        verts = np.empty((2 * len(x), 2), dtype=y.dtype)
+        verts[:len(x), 0] = x
+        verts[:len(x), 1] = y
+        verts[len(x):, 0] = x[::-1]
+        verts[len(x):, 1] = 0
+        collection.set_verts([verts])
+
+    def draw_spectrum(self):
         freqs, spectrum = self.audio_visualizer.get_spectrum_data()
 
-        ax.fill_between(freqs, spectrum, alpha=0.7, color=color)
-        ax.plot(freqs, spectrum, color=color, linewidth=2)
-
-        ax.set_xlim(0, 10000)
-        ax.set_ylim(0, 1)
-        ax.set_xlabel('Frequency (Hz)', color='white')
-        ax.set_ylabel('Amplitude', color='white')
-        ax.set_title('Frequency Spectrum', color='white')
-        ax.tick_params(colors='white')
-
-        # Remove spines
-        for spine in ax.spines.values():
-            spine.set_color('white')
-
-    def draw_waveform(self, color):
-        ax = self.figure.add_subplot(111, facecolor='black')
+        self._set_fill(self._spectrum_fill, freqs, spectrum)
+        self._spectrum_line.set_data(freqs, spectrum)
 
+    def draw_waveform(self):
         t, wave = self.audio_visualizer.get_waveform_data()
 
-        ax.plot(t, wave, color=color, linewidth=1)
-        ax.fill_between(t, wave, alpha=0.3, color=color)
-
-        ax.set_xlim(0, 1)
-        ax.set_ylim(-1, 1)
-        ax.set_xlabel('Time', color='white')
-        ax.set_ylabel('Amplitude', color='white')
-        ax.set_title('Waveform', color='white')
-        ax.tick_params(colors='white')
-
-        for spine in ax.spines.values():
-            spine.set_color('white')
-
-    def draw_bars(self, color):
-        ax = self.figure.add_subplot(111, facecolor='black')
+        self._waveform_line.set_data(t, wave)
+        self._set_fill(self._waveform_fill, t, wave)
 
+    def draw_bars(self):
         freqs, spectrum = self.audio_visualizer.get_spectrum_data()
 
         # Group frequencies into bars
-        num_bars = 32
+        num_bars = len(self._bar_verts)
         bar_width = len(spectrum) // num_bars
-        bar_heights = []
-
-        for i in range(num_bars):
-            start_idx = i * bar_width
-            end_idx = min((i + 1) * bar_width, len(spectrum))
-            bar_heights.append(np.mean(spectrum[start_idx:end_idx]))
-
-        bars = ax.bar(range(num_bars), bar_heights, color=color, alpha=0.8)
-
-        # Add glow effect
-        for bar in bars:
-            height = bar.get_height()
-            ax.bar(bar.get_x(),
-                   height * 0.5,
-                   bar.get_width(),
-                   bottom=height * 0.5,
-                   color=color,
-                   alpha=0.3)
-
-        ax.set_xlim(-0.5, num_bars - 0.5)
-        ax.set_ylim(0, 1)
-        ax.set_xlabel('Frequency Bands', color='white')
-        ax.set_ylabel('Amplitude', color='white')
-        ax.set_title('Frequency Bars', color='white')
-        ax.tick_params(colors='white')
-
-        for spine in ax.spines.values():
-            spine.set_color('white')
-
-    def draw_circle(self, color):
-        ax = self.figure.add_subplot(111, facecolor='black')
-
+        bar_heights = spectrum[:num_bars * bar_width].reshape(
+            num_bars, bar_width).mean(axis=1)
+
+        # Bars and their glow are persistent; only the top (and, for the
+        # glow, bottom) edges move
+        self._bar_verts[:, 2:, 1] = bar_heights[:, None]
+        self._bar_glow_verts[:, 2:, 1] = bar_heights[:, None]
+        self._bar_glow_verts[:, :2, 1] = (bar_heights * 0.5)[:, None]
+        self._bars.set_verts(self._bar_verts)
+        self._bar_glow.set_verts(self._bar_glow_verts)
+
+    def draw_circle(self):
         freqs, spectrum = self.audio_visualizer.get_spectrum_data()
 
-        # Create circular visualization
-        num_points = 64
-        angles = np.linspace(0, 2 * np.pi, num_points)
-
         # Sample spectrum data
-        indices = np.linspace(0, len(spectrum) - 1, num_points).astype(int)
-        amplitudes = spectrum[indices]
+        amplitudes = spectrum[self._circle_indices]
 
         # Convert to polar coordinates
         radius_base = 0.3
         radius = radius_base + amplitudes * 0.4
 
-        x = radius * np.cos(angles)
-        y = radius * np.sin(angles)
+        xy = self._circle_xy
+        x = xy[:, 0]
+        y = xy[:, 1]
+        np.multiply(radius, self._circle_cos, out=x[:-1])
+        np.multiply(radius, self._circle_sin, out=y[:-1])
 
         # Close the circle
-        x = np.append(x, x[0])
-        y = np.append(y, y[0])
+        xy[-1] = xy[0]
 
-        ax.fill(x, y, alpha=0.7, color=color)
-        ax.plot(x, y, color=color, linewidth=2)
+        self._circle_fill.set_xy(xy)
+        self._circle_line.set_data(x, y)
 
-        # Add center circle
-        circle = plt.Circle((0, 0), radius_base, color=color, alpha=0.3)
-        ax.add_patch(circle)
+    @staticmethod
+    def _resolve_music_maker():
+        """Find launch_music_maker for package or script execution"""
+        # Strategy 1: Relative import (when running as package)
+        try:
+            from .music_maker import launch_music_maker
+            return launch_music_maker
+        except (ImportError, SystemError, ValueError):
+            pass
+
+        # Strategy 2: Absolute import (when running as script)
+        try:
+            from music_visualizer.music_maker import launch_music_maker
+            return launch_music_maker
+        except ImportError:
+            pass
 
-        ax.set_xlim(-1, 1)
-        ax.set_ylim(-1, 1)
-        ax.set_aspect('equal')
-        ax.set_title('Circular Spectrum', color='white')
-        ax.axis('off')
+        # Strategy 3: Direct import with path manipulation
+        import importlib.util
+
+        # Get the directory of this file
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        music_maker_path = os.path.join(current_dir, 'music_maker', '__init__.py')
+
+        if not os.path.exists(music_maker_path):
+            raise ImportError("Could not locate music_maker module")
+
+        spec = importlib.util.spec_from_file_location("music_maker", music_maker_path)
+        music_maker_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(music_maker_module)
+        return music_maker_module.launch_music_maker
+
+    # Resolved once per process by on_music_maker
+    _launch_music_maker = None
 
     def on_music_maker(self, event):
         """Launch the Music Maker application."""
         try:
-            # Try different import strategies to handle both package and script execution
-            launch_music_maker = None
-            
-            # Strategy 1: Relative import (when running as package)
-            try:
-                from .music_maker import launch_music_maker
-            except (ImportError, SystemError, ValueError):
-                # Strategy 2: Absolute import (when running as script)
-                try:
-                    from music_visualizer.music_maker import launch_music_maker
-                except ImportError:
-                    # Strategy 3: Direct import with path manipulation
-                    import sys
-                    import os
-                    import importlib.util
-                    
-                    # Get the directory of this file
-                    current_dir = os.path.dirname(os.path.abspath(__file__))
-                    music_maker_path = os.path.join(current_dir, 'music_maker', '__init__.py')
-                    
-                    if os.path.exists(music_maker_path):
-                        spec = importlib.util.spec_from_file_location("music_maker", music_maker_path)
-                        music_maker_module = importlib.util.module_from_spec(spec)
-                        spec.loader.exec_module(music_maker_module)
-                        launch_music_maker = music_maker_module.launch_music_maker
-                    else:
-                        raise ImportError("Could not locate music_maker module")
-            
-            if launch_music_maker:
-                launch_music_maker()
-                self.status_bar.SetStatusText("Music Maker launched")
-            else:
-                raise ImportError("Could not import launch_music_maker function")
-                
+            cls = type(self)
+            if cls._launch_music_maker is None:
+                launch_music_maker = self._resolve_music_maker()
+                if not launch_music_maker:
+                    raise ImportError("Could not import launch_music_maker function")
+                cls._launch_music_maker = staticmethod(launch_music_maker)
+
+            self._launch_music_maker()
+            self.status_bar.SetStatusText("Music Maker launched")
+
         except Exception as e:
             error_msg = f"Failed to launch Music Maker: {e}"
             print(f"Debug: {error_msg}")  # Debug output
             wx.MessageBox(error_msg, "Error", wx.OK | wx.ICON_ERROR)
 
     def on_exit(self, event):
-        if self.update_timer:
-            self.update_timer.Stop()
+        self.stop_visualization_timer()
         self.Close()
 
 